@@ -29,6 +29,13 @@ API_BASE_URL = os.getenv(
     ),
 )
 
+# Maximum number of pooled connections kept per host by the Roboflow API session, default is 64
+API_POOL_MAXSIZE = int(os.getenv("API_POOL_MAXSIZE", 64))
+
+# Timeouts (connect, read) in seconds for Roboflow API requests, default is 3.05s / 30s
+API_CONNECT_TIMEOUT = float(os.getenv("API_CONNECT_TIMEOUT", 3.05))
+API_READ_TIMEOUT = float(os.getenv("API_READ_TIMEOUT", 30))
+
 # Debug flag for the API, default is False
 API_DEBUG = os.getenv("API_DEBUG", False)
 
@@ -124,12 +131,21 @@ DISABLE_PREPROC_CONTRAST = str2bool(os.getenv("DISABLE_PREPROC_CONTRAST", False)
 # Flag to disable grayscale preprocessing, default is False
 DISABLE_PREPROC_GRAYSCALE = str2bool(os.getenv("DISABLE_PREPROC_GRAYSCALE", False))
 
+# Flag to resize large images with OpenCV OpenCL (T-API) when a device is available, default is False
+PREPROC_OPENCL_ENABLED = str2bool(os.getenv("PREPROC_OPENCL_ENABLED", False))
+
+# Minimal number of pixels of an image to be resized with OpenCL, default is 4000000
+PREPROC_OPENCL_MIN_PIXELS = int(os.getenv("PREPROC_OPENCL_MIN_PIXELS", 4_000_000))
+
 # Flag to disable static crop preprocessing, default is False
 DISABLE_PREPROC_STATIC_CROP = str2bool(os.getenv("DISABLE_PREPROC_STATIC_CROP", False))
 
 # Flag to disable version check, default is False
 DISABLE_VERSION_CHECK = str2bool(os.getenv("DISABLE_VERSION_CHECK", False))
 
+# Flag to run dummy page through DocTR predictor when it is built, default is False
+DOCTR_WARMUP_ENABLED = str2bool(os.getenv("DOCTR_WARMUP_ENABLED", False))
+
 # ElastiCache endpoint
 ELASTICACHE_ENDPOINT = os.environ.get(
     "ELASTICACHE_ENDPOINT",
@@ -191,6 +207,15 @@ if MAX_BATCH_SIZE is not None:
 else:
     MAX_BATCH_SIZE = float("inf")
 
+# Flag to merge concurrent requests to dynamically batched models into one ONNX run, default is False
+COALESCE_INFERENCE_REQUESTS = str2bool(os.getenv("COALESCE_INFERENCE_REQUESTS", False))
+
+# Maximum number of images merged into one ONNX run, default is 16
+COALESCE_MAX_BATCH_SIZE = int(os.getenv("COALESCE_MAX_BATCH_SIZE", 16))
+
+# Time in milliseconds a request waits for others to be merged with, default is 2
+COALESCE_MAX_WAIT_MS = float(os.getenv("COALESCE_MAX_WAIT_MS", 2))
+
 # Maximum number of candidates, default is 3000
 MAX_CANDIDATES_ENV = "MAX_CANDIDATES"
 DEFAULT_MAX_CANDIDATES = 3000
@@ -238,6 +263,30 @@ ONNXRUNTIME_EXECUTION_PROVIDERS = os.getenv(
     "[CUDAExecutionProvider,OpenVINOExecutionProvider,CPUExecutionProvider]",
 )
 
+# Number of threads used by ONNX Runtime within a single operator, default is None (ONNX Runtime picks physical cores)
+ONNXRUNTIME_INTRA_OP_NUM_THREADS = os.getenv("ONNXRUNTIME_INTRA_OP_NUM_THREADS", None)
+if ONNXRUNTIME_INTRA_OP_NUM_THREADS is not None:
+    ONNXRUNTIME_INTRA_OP_NUM_THREADS = int(ONNXRUNTIME_INTRA_OP_NUM_THREADS)
+
+# Number of threads used by ONNX Runtime to run independent operators, default is 1
+ONNXRUNTIME_INTER_OP_NUM_THREADS = int(os.getenv("ONNXRUNTIME_INTER_OP_NUM_THREADS", 1))
+
+# Flag to run models on CUDA with weights converted to FP16, default is False
+ONNXRUNTIME_FP16_WEIGHTS = str2bool(os.getenv("ONNXRUNTIME_FP16_WEIGHTS", False))
+
+# Flag to run CPU-only models on weights with dynamic INT8 quantization, default is False
+ONNXRUNTIME_INT8_WEIGHTS = str2bool(os.getenv("ONNXRUNTIME_INT8_WEIGHTS", False))
+
+# Flag to run CUDA sessions through IOBinding with per-thread device input buffers, default is False
+ONNXRUNTIME_IO_BINDING_ENABLED = str2bool(
+    os.getenv("ONNXRUNTIME_IO_BINDING_ENABLED", False)
+)
+
+# Number of threads shared by all models to load and preprocess images, default is the number of CPUs
+IMAGE_LOADER_NUM_THREADS = int(
+    os.getenv("IMAGE_LOADER_NUM_THREADS", os.cpu_count() or 4)
+)
+
 # Port, default is 9001
 PORT = int(os.getenv("PORT", 9001))
 
@@ -255,6 +304,14 @@ REDIS_TIMEOUT = float(os.getenv("REDIS_TIMEOUT", 2.0))
 # Required ONNX providers, default is None
 REQUIRED_ONNX_PROVIDERS = safe_split_value(os.getenv("REQUIRED_ONNX_PROVIDERS", None))
 
+# Flag to serve last known Roboflow API metadata when API is unreachable or responds
+# with 5xx error, default is False
+ROBOFLOW_CACHE_FALLBACK = str2bool(os.getenv("ROBOFLOW_CACHE_FALLBACK", False))
+
+# Time in seconds for which workspace / dataset / model type metadata fetched from
+# Roboflow API is kept in process memory, default is 600 (0 disables the cache)
+ROBOFLOW_METADATA_TTL_SECONDS = int(os.getenv("ROBOFLOW_METADATA_TTL_SECONDS", 600))
+
 # Roboflow server UUID
 ROBOFLOW_SERVER_UUID = os.getenv("ROBOFLOW_SERVER_UUID", str(uuid.uuid4()))
 
@@ -177,7 +177,7 @@ class ClassificationBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceModel):
         )
 
     def predict(self, img_in: np.ndarray, **kwargs) -> Tuple[np.ndarray]:
-        predictions = self.onnx_session.run(None, {self.input_name: img_in})
+        predictions = self.run_onnx_session(img_in)
         return (predictions,)
 
     def preprocess(
@@ -225,7 +225,7 @@ class ClassificationBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceModel):
         mean = (0.5, 0.5, 0.5)
         std = (0.5, 0.5, 0.5)
 
-        img_in = img_in.astype(np.float32)
+        img_in = img_in.astype(np.float32, copy=False)
 
         img_in[:, 0, :, :] = (img_in[:, 0, :, :] - mean[0]) / std[0]
         img_in[:, 1, :, :] = (img_in[:, 1, :, :] - mean[1]) / std[1]
@@ -1,11 +1,10 @@
 import itertools
 import json
 import os
-from collections import OrderedDict
+import threading
 from concurrent.futures import ThreadPoolExecutor
-from functools import partial
 from time import perf_counter
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import cv2
 import numpy as np
@@ -21,7 +20,6 @@ from inference.core.cache.model_artifacts import (
     initialise_cache,
     load_json_from_cache,
     load_text_file_from_cache,
-    save_bytes_in_cache,
     save_json_in_cache,
     save_text_lines_in_cache,
 )
@@ -35,41 +33,65 @@ from inference.core.env import (
     API_KEY,
     AWS_ACCESS_KEY_ID,
     AWS_SECRET_ACCESS_KEY,
+    COALESCE_INFERENCE_REQUESTS,
+    COALESCE_MAX_BATCH_SIZE,
+    COALESCE_MAX_WAIT_MS,
     CORE_MODEL_BUCKET,
     DISABLE_PREPROC_AUTO_ORIENT,
+    IMAGE_LOADER_NUM_THREADS,
     INFER_BUCKET,
     LAMBDA,
     MAX_BATCH_SIZE,
     MODEL_CACHE_DIR,
     MODEL_VALIDATION_DISABLED,
     ONNXRUNTIME_EXECUTION_PROVIDERS,
+    ONNXRUNTIME_FP16_WEIGHTS,
+    ONNXRUNTIME_INT8_WEIGHTS,
+    ONNXRUNTIME_INTER_OP_NUM_THREADS,
+    ONNXRUNTIME_INTRA_OP_NUM_THREADS,
+    ONNXRUNTIME_IO_BINDING_ENABLED,
     REQUIRED_ONNX_PROVIDERS,
     TENSORRT_CACHE_PATH,
 )
-from inference.core.exceptions import ModelArtefactError, OnnxProviderNotAvailable
+from inference.core.exceptions import ModelArtefactError
 from inference.core.logger import logger
 from inference.core.models.base import Model
-from inference.core.models.utils.batching import create_batches
-from inference.core.models.utils.onnx import has_trt
+from inference.core.models.utils.batching import RunCoalescer, create_batches
+from inference.core.models.utils.onnx import (
+    convert_weights_to_fp16,
+    get_available_providers,
+    get_effective_provider_names,
+    has_compiling_provider,
+    has_trt,
+    quantize_weights_to_int8,
+    runs_on_cpu_only,
+    validate_required_providers_available,
+)
 from inference.core.roboflow_api import (
     ModelEndpointType,
+    download_file_from_url,
     get_from_url,
     get_roboflow_model_data,
 )
 from inference.core.utils.image_utils import load_image
 from inference.core.utils.onnx import get_onnxruntime_execution_providers
-from inference.core.utils.preprocess import letterbox_image, prepare
-from inference.core.utils.visualisation import draw_detection_predictions
+from inference.core.utils.preprocess import letterbox_image, prepare, resize_image
+from inference.core.utils.visualisation import draw_detection_predictions, hex_to_rgb
 from inference.models.aliases import resolve_roboflow_model_alias
 
 NUM_S3_RETRY = 5
 SLEEP_SECONDS_BETWEEN_RETRIES = 3
 MODEL_METADATA_CACHE_EXPIRATION_TIMEOUT = 3600  # 1 hour
+FP16_WEIGHTS_FILE = "weights.fp16.onnx"
+INT8_WEIGHTS_FILE = "weights.int8.onnx"
+S3_MULTIPART_CHUNK_SIZE = 16 * 1024 * 1024
+S3_MAX_CONCURRENT_REQUESTS = 16
 
 S3_CLIENT = None
 if AWS_ACCESS_KEY_ID and AWS_ACCESS_KEY_ID:
     try:
         import boto3
+        from boto3.s3.transfer import TransferConfig
         from botocore.config import Config
 
         from inference.core.utils.s3 import download_s3_files_to_directory
@@ -80,6 +102,15 @@ if AWS_ACCESS_KEY_ID and AWS_ACCESS_KEY_ID:
         logger.debug("Error loading boto3")
         pass
 
+# a pool per model instance oversubscribes cores as soon as several models are loaded
+IMAGE_LOADER_THREADPOOL = ThreadPoolExecutor(
+    max_workers=IMAGE_LOADER_NUM_THREADS, thread_name_prefix="image_loader"
+)
+# OpenCV worker threads would multiply with the image loader pool
+cv2.setNumThreads(1)
+
+_RESIZE_BUFFERS = threading.local()
+
 DEFAULT_COLOR_PALETTE = [
     "#4892EA",
     "#00EEC3",
@@ -155,7 +186,7 @@ class RoboflowInferenceModel(Model):
         return draw_detection_predictions(
             inference_request=inference_request,
             inference_response=inference_response,
-            colors=self.colors,
+            colors=self.colors_rgb,
         )
 
     @property
@@ -224,10 +255,17 @@ class RoboflowInferenceModel(Model):
         self.download_model_artifacts_from_roboflow_api()
 
     def get_all_required_infer_bucket_file(self) -> List[str]:
+        # list is fixed for model instance and needed several times while loading artefacts
+        required_files = getattr(self, "_required_infer_bucket_files", None)
+        if required_files is not None:
+            return list(required_files)
         infer_bucket_files = self.get_infer_bucket_file_list()
         infer_bucket_files.append(self.weights_file)
         logger.debug(f"List of files required to load model: {infer_bucket_files}")
-        return [f for f in infer_bucket_files if f is not None]
+        self._required_infer_bucket_files = [
+            f for f in infer_bucket_files if f is not None
+        ]
+        return list(self._required_infer_bucket_files)
 
     def download_model_artefacts_from_s3(self) -> None:
         try:
@@ -235,12 +273,30 @@ class RoboflowInferenceModel(Model):
             infer_bucket_files = self.get_all_required_infer_bucket_file()
             cache_directory = get_cache_dir()
             s3_keys = [f"{self.endpoint}/{file}" for file in infer_bucket_files]
+            weights_key = (
+                f"{self.endpoint}/{self.weights_file}"
+                if self.weights_file is not None
+                else None
+            )
             download_s3_files_to_directory(
                 bucket=self.model_artifact_bucket,
-                keys=s3_keys,
+                keys=[key for key in s3_keys if key != weights_key],
                 target_dir=cache_directory,
                 s3_client=S3_CLIENT,
             )
+            if weights_key in s3_keys:
+                # weights are the only large artefact - fetch them with concurrent ranged GETs
+                download_s3_files_to_directory(
+                    bucket=self.model_artifact_bucket,
+                    keys=[weights_key],
+                    target_dir=cache_directory,
+                    s3_client=S3_CLIENT,
+                    transfer_config=TransferConfig(
+                        multipart_threshold=S3_MULTIPART_CHUNK_SIZE,
+                        multipart_chunksize=S3_MULTIPART_CHUNK_SIZE,
+                        max_concurrency=S3_MAX_CONCURRENT_REQUESTS,
+                    ),
+                )
         except Exception as error:
             raise ModelArtefactError(
                 f"Could not obtain model artefacts from S3 with keys {s3_keys}. Cause: {error}"
@@ -278,11 +334,8 @@ class RoboflowInferenceModel(Model):
                 "Could not find `environment` key in roboflow API model description response."
             )
         environment = get_from_url(api_data["environment"])
-        model_weights_response = get_from_url(api_data["model"], json_response=False)
-        save_bytes_in_cache(
-            content=model_weights_response.content,
-            file=self.weights_file,
-            model_id=self.endpoint,
+        download_file_from_url(
+            url=api_data["model"], target_path=self.cache_file(self.weights_file)
         )
         if "colors" in api_data:
             environment["COLORS"] = api_data["colors"]
@@ -306,7 +359,6 @@ class RoboflowInferenceModel(Model):
             self.environment = load_json_from_cache(
                 file="environment.json",
                 model_id=self.endpoint,
-                object_pairs_hook=OrderedDict,
             )
         if "class_names.txt" in infer_bucket_files:
             self.class_names = load_text_file_from_cache(
@@ -323,12 +375,15 @@ class RoboflowInferenceModel(Model):
             environment=self.environment,
             class_names=self.class_names,
         )
+        # parsed once, so drawing predictions does not convert hex strings per box
+        self.colors_rgb = {
+            class_name: hex_to_rgb(color) for class_name, color in self.colors.items()
+        }
         if "keypoints_metadata.json" in infer_bucket_files:
             self.keypoints_metadata = parse_keypoints_metadata(
                 load_json_from_cache(
                     file="keypoints_metadata.json",
                     model_id=self.endpoint,
-                    object_pairs_hook=OrderedDict,
                 )
             )
         self.num_classes = len(self.class_names)
@@ -369,6 +424,7 @@ class RoboflowInferenceModel(Model):
         disable_preproc_contrast: bool = False,
         disable_preproc_grayscale: bool = False,
         disable_preproc_static_crop: bool = False,
+        out: Optional[np.ndarray] = None,
     ) -> Tuple[np.ndarray, Tuple[int, int]]:
         """
         Preprocesses an inference request image by loading it, then applying any pre-processing specified by the Roboflow platform, then scaling it to the inference input dimensions.
@@ -379,6 +435,7 @@ class RoboflowInferenceModel(Model):
             disable_preproc_contrast (bool, optional): If true, the contrast preprocessing step is disabled for this call. Default is False.
             disable_preproc_grayscale (bool, optional): If true, the grayscale preprocessing step is disabled for this call. Default is False.
             disable_preproc_static_crop (bool, optional): If true, the static crop preprocessing step is disabled for this call. Default is False.
+            out (np.ndarray, optional): Preallocated float32 array of shape (1, 3, H, W) to write the result into. Allocated if not given.
 
         Returns:
             Tuple[np.ndarray, Tuple[int, int]]: A tuple containing a numpy array of the preprocessed image pixel data and a tuple of the images original size.
@@ -397,8 +454,15 @@ class RoboflowInferenceModel(Model):
         )
 
         if self.resize_method == "Stretch to":
-            resized = cv2.resize(
-                preprocessed_image, (self.img_size_w, self.img_size_h), cv2.INTER_CUBIC
+            resized = resize_image(
+                preprocessed_image,
+                (self.img_size_w, self.img_size_h),
+                interpolation=cv2.INTER_LINEAR,
+                dst=_get_resize_buffer(
+                    height=self.img_size_h,
+                    width=self.img_size_w,
+                    channels=preprocessed_image.shape[2],
+                ),
             )
         elif self.resize_method == "Fit (black edges) in":
             resized = letterbox_image(
@@ -417,13 +481,10 @@ class RoboflowInferenceModel(Model):
                 color=(114, 114, 114),
             )
 
-        if is_bgr:
-            resized = cv2.cvtColor(resized, cv2.COLOR_BGR2RGB)
-        img_in = np.transpose(resized, (2, 0, 1))
-        img_in = img_in.astype(np.float32)
-        img_in = np.expand_dims(img_in, axis=0)
-
-        return img_in, img_dims
+        if out is None:
+            out = np.empty((1, 3, self.img_size_h, self.img_size_w), dtype=np.float32)
+        _fuse_resize_to_nchw(resized, out, is_bgr)
+        return out, img_dims
 
     def preprocess_image(
         self,
@@ -510,12 +571,9 @@ class RoboflowCoreModel(RoboflowInferenceModel):
         for weights_url_key in api_data["weights"]:
             weights_url = api_data["weights"][weights_url_key]
             t1 = perf_counter()
-            model_weights_response = get_from_url(weights_url, json_response=False)
             filename = weights_url.split("?")[0].split("/")[-1]
-            save_bytes_in_cache(
-                content=model_weights_response.content,
-                file=filename,
-                model_id=self.endpoint,
+            download_file_from_url(
+                url=weights_url, target_path=self.cache_file(filename)
             )
             if perf_counter() - t1 > 120:
                 logger.debug(
@@ -608,8 +666,12 @@ class OnnxRoboflowInferenceModel(RoboflowInferenceModel):
                 expanded_execution_providers.append(ep)
             self.onnxruntime_execution_providers = expanded_execution_providers
 
+        self._io_binding_enabled = False
+        # IOBinding is not safe to share between concurrent runs - each thread gets its own
+        self._io_binding_state = threading.local()
+        self._run_coalescer = None
         self.initialize_model()
-        self.image_loader_threadpool = ThreadPoolExecutor(max_workers=None)
+        self.image_loader_threadpool = IMAGE_LOADER_THREADPOOL
         try:
             self.validate_model()
         except ModelArtefactError as e:
@@ -639,6 +701,158 @@ class OnnxRoboflowInferenceModel(RoboflowInferenceModel):
     def merge_inference_results(self, inference_results: List[Any]) -> Any:
         return list(itertools.chain(*inference_results))
 
+    def run_onnx_session(self, img_in: np.ndarray) -> List[np.ndarray]:
+        """Runs the ONNX session on the given input, using IOBinding when it is set up for the session.
+
+        Args:
+            img_in (np.ndarray): Preprocessed model input in NCHW layout.
+
+        Returns:
+            List[np.ndarray]: Model outputs in the order declared by the ONNX graph.
+        """
+        if self._run_coalescer is not None:
+            return self._run_coalescer.run(img_in)
+        return self._run_session(img_in)
+
+    def _run_session(self, img_in: np.ndarray) -> List[np.ndarray]:
+        if self._io_binding_enabled:
+            return self._run_with_binding(img_in=img_in)
+        return self.onnx_session.run(None, {self.input_name: img_in})
+
+    def get_fp16_weights_path(self, weights_path: str) -> str:
+        """Returns path to weights converted to FP16, converting them on first use.
+
+        Args:
+            weights_path (str): Path to the original FP32 weights.
+
+        Returns:
+            str: Path to FP16 weights, or the original path if conversion is not possible.
+        """
+        return self._get_converted_weights_path(
+            weights_path=weights_path,
+            converted_weights_file=FP16_WEIGHTS_FILE,
+            convert_weights=convert_weights_to_fp16,
+        )
+
+    def get_int8_weights_path(self, weights_path: str) -> str:
+        """Returns path to weights with dynamic INT8 quantization, quantizing them on first use.
+
+        Args:
+            weights_path (str): Path to the original FP32 weights.
+
+        Returns:
+            str: Path to INT8 weights, or the original path if quantization is not possible.
+        """
+        return self._get_converted_weights_path(
+            weights_path=weights_path,
+            converted_weights_file=INT8_WEIGHTS_FILE,
+            convert_weights=quantize_weights_to_int8,
+        )
+
+    def _get_optimized_weights_path(
+        self, weights_path: str, providers: list, provider_names: List[str]
+    ) -> str:
+        optimized_weights_path = self.cache_file(
+            get_optimized_weights_file(
+                weights_file=os.path.basename(weights_path),
+                provider_names=provider_names,
+            )
+        )
+        if is_optimized_model_up_to_date(
+            weights_path=weights_path,
+            optimized_weights_path=optimized_weights_path,
+        ):
+            # layout optimizations are not serialised, ORT applies them on load
+            logger.debug("Loading optimized ONNX graph from cache")
+            return optimized_weights_path
+        # other workers sharing the cache must never see a partially written graph
+        tmp_path = f"{optimized_weights_path}.{os.getpid()}.tmp"
+        try:
+            # ORT_ENABLE_ALL adds layout transforms tied to the host CPU, the serialised
+            # graph must stay portable - throwaway session only writes the graph, the
+            # serving session loads it with all optimizations enabled
+            session_options = onnxruntime.SessionOptions()
+            session_options.graph_optimization_level = (
+                onnxruntime.GraphOptimizationLevel.ORT_ENABLE_EXTENDED
+            )
+            session_options.optimized_model_filepath = tmp_path
+            onnxruntime.InferenceSession(
+                weights_path, providers=providers, sess_options=session_options
+            )
+            os.replace(tmp_path, optimized_weights_path)
+        except Exception as error:
+            logger.warning(
+                f"Could not cache optimized ONNX graph for model {self.endpoint}, using original weights. Cause: {error}"
+            )
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return weights_path
+        return optimized_weights_path
+
+    def _get_converted_weights_path(
+        self,
+        weights_path: str,
+        converted_weights_file: str,
+        convert_weights: Callable[[str, str], None],
+    ) -> str:
+        converted_weights_path = self.cache_file(converted_weights_file)
+        if is_optimized_model_up_to_date(
+            weights_path=weights_path, optimized_weights_path=converted_weights_path
+        ):
+            return converted_weights_path
+        try:
+            convert_weights(weights_path, converted_weights_path)
+        except Exception as error:
+            logger.warning(
+                f"Could not produce {converted_weights_file} for model {self.endpoint}, using original weights. Cause: {error}"
+            )
+            return weights_path
+        return converted_weights_path
+
+    def _run_with_binding(self, img_in: np.ndarray) -> List[np.ndarray]:
+        img_in = np.ascontiguousarray(img_in, dtype=np.float32)
+        state = self._io_binding_state
+        if getattr(state, "io_binding", None) is None:
+            state.io_binding = self._create_io_binding()
+            state.input_value = None
+        if state.input_value is None or state.input_value.shape() != list(img_in.shape):
+            # device buffer is reallocated only when the batch size changes
+            state.input_value = onnxruntime.OrtValue.ortvalue_from_numpy(
+                img_in, "cuda", 0
+            )
+            state.io_binding.bind_ortvalue_input(self.input_name, state.input_value)
+        else:
+            state.input_value.update_inplace(img_in)
+        self.onnx_session.run_with_iobinding(state.io_binding)
+        return state.io_binding.copy_outputs_to_cpu()
+
+    def _create_io_binding(self) -> onnxruntime.IOBinding:
+        io_binding = self.onnx_session.io_binding()
+        for output in self.onnx_session.get_outputs():
+            # output shapes may depend on input - ORT allocates device buffers per run
+            io_binding.bind_output(output.name, "cuda")
+        return io_binding
+
+    def _initialize_io_binding(self) -> None:
+        # binding keeps a device input buffer per thread and model - opt-in until it
+        # proves faster than plain session.run() on a given deployment
+        if not ONNXRUNTIME_IO_BINDING_ENABLED:
+            return None
+        if "CUDAExecutionProvider" not in self.onnx_session.get_providers():
+            return None
+        self._io_binding_enabled = True
+        logger.debug(f"IOBinding enabled for model {self.endpoint}")
+
+    def _initialize_run_coalescer(self) -> None:
+        if not COALESCE_INFERENCE_REQUESTS or not self.batching_enabled:
+            return None
+        self._run_coalescer = RunCoalescer(
+            run_batch=self._run_session,
+            max_batch_size=min(COALESCE_MAX_BATCH_SIZE, MAX_BATCH_SIZE),
+            max_wait_ms=COALESCE_MAX_WAIT_MS,
+        )
+        logger.debug(f"Coalescing of concurrent runs enabled for model {self.endpoint}")
+
     def validate_model(self) -> None:
         if MODEL_VALIDATION_DISABLED:
             logger.debug("Model validation disabled.")
@@ -702,15 +916,64 @@ class OnnxRoboflowInferenceModel(RoboflowInferenceModel):
 
             if not self.load_weights:
                 providers = ["OpenVINOExecutionProvider", "CPUExecutionProvider"]
+            available_providers = get_available_providers()
+            effective_providers = get_effective_provider_names(
+                providers=providers, available_providers=available_providers
+            )
+            weights_path = self.cache_file(self.weights_file)
+            # TensorRT builds FP16 engines on its own (trt_fp16_enable)
+            if (
+                ONNXRUNTIME_FP16_WEIGHTS
+                and "CUDAExecutionProvider" in effective_providers
+                and "TensorrtExecutionProvider" not in effective_providers
+            ):
+                weights_path = self.get_fp16_weights_path(weights_path=weights_path)
+            elif (
+                ONNXRUNTIME_INT8_WEIGHTS
+                and self.load_weights
+                and effective_providers == ["CPUExecutionProvider"]
+            ):
+                weights_path = self.get_int8_weights_path(weights_path=weights_path)
             try:
                 session_options = onnxruntime.SessionOptions()
+                session_options.graph_optimization_level = (
+                    onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+                )
+                session_options.execution_mode = (
+                    onnxruntime.ExecutionMode.ORT_SEQUENTIAL
+                )
+                if ONNXRUNTIME_INTRA_OP_NUM_THREADS is not None:
+                    session_options.intra_op_num_threads = (
+                        ONNXRUNTIME_INTRA_OP_NUM_THREADS
+                    )
+                session_options.inter_op_num_threads = ONNXRUNTIME_INTER_OP_NUM_THREADS
+                session_options.enable_mem_pattern = True
+                session_options.enable_cpu_mem_arena = True
+                if runs_on_cpu_only(
+                    providers=providers,
+                    available_providers=available_providers,
+                ):
+                    # busy-waiting intra-op threads compete for cores with request handling
+                    session_options.add_session_config_entry(
+                        "session.intra_op.allow_spinning", "0"
+                    )
                 # TensorRT does better graph optimization for its EP than onnx
                 if has_trt(providers):
                     session_options.graph_optimization_level = (
                         onnxruntime.GraphOptimizationLevel.ORT_DISABLE_ALL
                     )
+                elif not LAMBDA and not has_compiling_provider(
+                    providers=providers, available_providers=available_providers
+                ):
+                    # on Lambda the model cache does not outlive the instance, so
+                    # serialising the optimised graph would only double session creation
+                    weights_path = self._get_optimized_weights_path(
+                        weights_path=weights_path,
+                        providers=providers,
+                        provider_names=effective_providers,
+                    )
                 self.onnx_session = onnxruntime.InferenceSession(
-                    self.cache_file(self.weights_file),
+                    weights_path,
                     providers=providers,
                     sess_options=session_options,
                 )
@@ -722,12 +985,7 @@ class OnnxRoboflowInferenceModel(RoboflowInferenceModel):
             logger.debug(f"Session created in {perf_counter() - t1_session} seconds")
 
             if REQUIRED_ONNX_PROVIDERS:
-                available_providers = onnxruntime.get_available_providers()
-                for provider in REQUIRED_ONNX_PROVIDERS:
-                    if provider not in available_providers:
-                        raise OnnxProviderNotAvailable(
-                            f"Required ONNX Execution Provider {provider} is not availble. Check that you are using the correct docker image on a supported device."
-                        )
+                validate_required_providers_available(REQUIRED_ONNX_PROVIDERS)
 
             inputs = self.onnx_session.get_inputs()[0]
             input_shape = inputs.shape
@@ -763,6 +1021,9 @@ class OnnxRoboflowInferenceModel(RoboflowInferenceModel):
             self.write_model_metadata_to_memcache(model_metadata)
             if not self.load_weights:  # had to load weights to get metadata
                 del self.onnx_session
+            else:
+                self._initialize_io_binding()
+                self._initialize_run_coalescer()
         else:
             if not self.has_model_metadata:
                 raise ValueError(
@@ -794,16 +1055,27 @@ class OnnxRoboflowInferenceModel(RoboflowInferenceModel):
         disable_preproc_static_crop: bool = False,
     ) -> Tuple[np.ndarray, Tuple[int, int]]:
         if isinstance(image, list):
-            preproc_image = partial(
-                self.preproc_image,
-                disable_preproc_auto_orient=disable_preproc_auto_orient,
-                disable_preproc_contrast=disable_preproc_contrast,
-                disable_preproc_grayscale=disable_preproc_grayscale,
-                disable_preproc_static_crop=disable_preproc_static_crop,
+            img_in = np.empty(
+                (len(image), 3, self.img_size_h, self.img_size_w), dtype=np.float32
+            )
+
+            def preproc_image_into_batch(indexed_image: Tuple[int, Any]) -> Tuple:
+                i, single_image = indexed_image
+                _, single_image_dims = self.preproc_image(
+                    single_image,
+                    disable_preproc_auto_orient=disable_preproc_auto_orient,
+                    disable_preproc_contrast=disable_preproc_contrast,
+                    disable_preproc_grayscale=disable_preproc_grayscale,
+                    disable_preproc_static_crop=disable_preproc_static_crop,
+                    out=img_in[i : i + 1],
+                )
+                return single_image_dims
+
+            img_dims = list(
+                self.image_loader_threadpool.map(
+                    preproc_image_into_batch, enumerate(image)
+                )
             )
-            imgs_with_dims = self.image_loader_threadpool.map(preproc_image, image)
-            imgs, img_dims = zip(*imgs_with_dims)
-            img_in = np.concatenate(imgs, axis=0)
         else:
             img_in, img_dims = self.preproc_image(
                 image,
@@ -831,6 +1103,26 @@ class OnnxRoboflowCoreModel(RoboflowCoreModel):
     pass
 
 
+def _get_resize_buffer(height: int, width: int, channels: int) -> np.ndarray:
+    # resized image is copied into model input right away, so each thread reuses its buffer
+    buffers = getattr(_RESIZE_BUFFERS, "buffers", None)
+    if buffers is None:
+        buffers = _RESIZE_BUFFERS.buffers = {}
+    shape = (height, width, channels)
+    if shape not in buffers:
+        buffers[shape] = np.empty(shape, dtype=np.uint8)
+    return buffers[shape]
+
+
+def _fuse_resize_to_nchw(
+    resized: np.ndarray, out: np.ndarray, bgr_to_rgb: bool
+) -> None:
+    # channel swap and HWC -> CHW transpose are free views, so the assignment below
+    # does the layout change and float32 cast in a single strided copy
+    source = resized[:, :, ::-1] if bgr_to_rgb else resized
+    out[0] = source.transpose(2, 0, 1)
+
+
 def get_class_names_from_environment_file(environment: Optional[dict]) -> List[str]:
     if environment is None:
         raise ModelArtefactError(
@@ -871,6 +1163,23 @@ def color_mapping_available_in_environment(environment: Optional[dict]) -> bool:
     )
 
 
+def get_optimized_weights_file(weights_file: str, provider_names: List[str]) -> str:
+    # optimized graph depends on execution providers and ORT version it was produced with
+    providers_tag = "-".join(
+        name.replace("ExecutionProvider", "").lower() for name in provider_names
+    )
+    weights_name, _ = os.path.splitext(weights_file)
+    return f"{weights_name}.optimized.ort{onnxruntime.__version__}.{providers_tag}.onnx"
+
+
+def is_optimized_model_up_to_date(
+    weights_path: str, optimized_weights_path: str
+) -> bool:
+    if not os.path.isfile(optimized_weights_path):
+        return False
+    return os.path.getmtime(optimized_weights_path) >= os.path.getmtime(weights_path)
+
+
 def is_model_artefacts_bucket_available() -> bool:
     return (
         AWS_ACCESS_KEY_ID is not None
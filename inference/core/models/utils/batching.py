@@ -1,4 +1,8 @@
-from typing import Generator, Iterable, List, TypeVar
+import threading
+from concurrent.futures import Future
+from typing import Callable, Generator, Iterable, List, Optional, Tuple, TypeVar
+
+import numpy as np
 
 B = TypeVar("B")
 
@@ -15,3 +19,123 @@ def create_batches(
         current_batch.append(element)
     if len(current_batch) > 0:
         yield current_batch
+
+
+class RunCoalescer:
+    """Merges inputs of concurrent calls into one batched run.
+
+    The first caller to arrive becomes the leader of the batch - it waits up to `max_wait_ms` for
+    other callers to join (or until `max_batch_size` images are gathered), runs the merged batch
+    and hands every caller its slice of the outputs. A merged batch never exceeds `max_batch_size` -
+    a call that does not fit starts the next batch, a call that fills it on its own runs alone. No background thread is involved, so the
+    coalescer lives and dies with the model owning it.
+    """
+
+    def __init__(
+        self,
+        run_batch: Callable[[np.ndarray], List[np.ndarray]],
+        max_batch_size: int,
+        max_wait_ms: float,
+    ):
+        self._run_batch = run_batch
+        self._max_batch_size = max_batch_size
+        self._max_wait = max_wait_ms / 1000
+        self._lock = threading.Lock()
+        self._pending: List[Tuple[np.ndarray, Future]] = []
+        self._pending_size = 0
+        self._batch_full: Optional[threading.Event] = None
+        self._outputs_batch_first = True
+
+    def run(self, img_in: np.ndarray) -> List[np.ndarray]:
+        if not self._outputs_batch_first or img_in.shape[0] >= self._max_batch_size:
+            return self._run_batch(img_in)
+        future = Future()
+        with self._lock:
+            if self._pending_size + img_in.shape[0] > self._max_batch_size:
+                # joining would overflow the batch - current group is run as it is
+                # and this call starts a new one
+                self._close_pending_group()
+            is_leader = len(self._pending) == 0
+            if is_leader:
+                self._batch_full = threading.Event()
+            group, batch_full = self._pending, self._batch_full
+            group.append((img_in, future))
+            self._pending_size += img_in.shape[0]
+            if self._pending_size >= self._max_batch_size:
+                self._close_pending_group()
+        if is_leader:
+            batch_full.wait(timeout=self._max_wait)
+            with self._lock:
+                if self._pending is group:
+                    self._close_pending_group()
+            self._run_pending(pending=group)
+        return future.result()
+
+    def _close_pending_group(self) -> None:
+        # must be called with the lock held - no call can join the group afterwards
+        self._batch_full.set()
+        self._pending, self._pending_size = [], 0
+
+    def _run_pending(self, pending: List[Tuple[np.ndarray, Future]]) -> None:
+        try:
+            for inputs in _group_by_shape(pending=pending):
+                try:
+                    self._run_group(inputs=inputs)
+                except Exception as error:
+                    _fail_pending_futures(pending=inputs, error=error)
+        finally:
+            # callers of the group block on their futures - none can be left unresolved
+            _fail_pending_futures(
+                pending=pending,
+                error=RuntimeError("Batched inference run aborted."),
+            )
+
+    def _run_group(self, inputs: List[Tuple[np.ndarray, Future]]) -> None:
+        if len(inputs) == 1:
+            self._run_single(img_in=inputs[0][0], future=inputs[0][1])
+            return None
+        try:
+            outputs = self._run_batch(
+                np.concatenate([img_in for img_in, _ in inputs], axis=0)
+            )
+        except Exception as error:
+            _fail_pending_futures(pending=inputs, error=error)
+            return None
+        batch_size = sum(img_in.shape[0] for img_in, _ in inputs)
+        if any(
+            not isinstance(output, np.ndarray) or output.shape[0] != batch_size
+            for output in outputs
+        ):
+            # outputs cannot be split per caller - model is served call by call from now on
+            self._outputs_batch_first = False
+            for img_in, future in inputs:
+                self._run_single(img_in=img_in, future=future)
+            return None
+        start = 0
+        for img_in, future in inputs:
+            end = start + img_in.shape[0]
+            future.set_result([output[start:end] for output in outputs])
+            start = end
+
+    def _run_single(self, img_in: np.ndarray, future: Future) -> None:
+        try:
+            future.set_result(self._run_batch(img_in))
+        except Exception as error:
+            future.set_exception(error)
+
+
+def _group_by_shape(
+    pending: List[Tuple[np.ndarray, Future]]
+) -> List[List[Tuple[np.ndarray, Future]]]:
+    groups = {}
+    for img_in, future in pending:
+        groups.setdefault(img_in.shape[1:], []).append((img_in, future))
+    return list(groups.values())
+
+
+def _fail_pending_futures(
+    pending: List[Tuple[np.ndarray, Future]], error: BaseException
+) -> None:
+    for _, future in pending:
+        if not future.done():
+            future.set_exception(error)
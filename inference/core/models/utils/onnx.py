@@ -1,5 +1,36 @@
+import os
+from functools import lru_cache
 from typing import Dict, List, Tuple, Union
 
+import onnxruntime
+
+from inference.core.exceptions import OnnxProviderNotAvailable
+
+# providers compiling subgraphs into their own kernels - ORT cannot serialise such graphs
+COMPILING_EXECUTION_PROVIDERS = {
+    "TensorrtExecutionProvider",
+    "OpenVINOExecutionProvider",
+    "CoreMLExecutionProvider",
+}
+
+
+@lru_cache(maxsize=1)
+def get_available_providers() -> Tuple[str, ...]:
+    # providers are fixed by the installed ORT build, probing once per process is enough
+    return tuple(onnxruntime.get_available_providers())
+
+
+def validate_required_providers_available(required_providers: List[str]) -> None:
+    missing_providers = [
+        provider
+        for provider in required_providers
+        if provider not in get_available_providers()
+    ]
+    if missing_providers:
+        raise OnnxProviderNotAvailable(
+            f"Required ONNX Execution Provider {missing_providers[0]} is not availble. Check that you are using the correct docker image on a supported device."
+        )
+
 
 def has_trt(providers: List[Union[Tuple[str, Dict], str]]) -> bool:
     for p in providers:
@@ -10,3 +41,65 @@ def has_trt(providers: List[Union[Tuple[str, Dict], str]]) -> bool:
         if name == "TensorrtExecutionProvider":
             return True
     return False
+
+
+def runs_on_cpu_only(
+    providers: List[Union[Tuple[str, Dict], str]],
+    available_providers: List[str],
+) -> bool:
+    for p in providers:
+        if isinstance(p, tuple):
+            name = p[0]
+        else:
+            name = p
+        if name in available_providers and name != "CPUExecutionProvider":
+            return False
+    return True
+
+
+def has_compiling_provider(
+    providers: List[Union[Tuple[str, Dict], str]],
+    available_providers: List[str],
+) -> bool:
+    for p in providers:
+        if isinstance(p, tuple):
+            name = p[0]
+        else:
+            name = p
+        if name in available_providers and name in COMPILING_EXECUTION_PROVIDERS:
+            return True
+    return False
+
+
+def get_effective_provider_names(
+    providers: List[Union[Tuple[str, Dict], str]],
+    available_providers: List[str],
+) -> List[str]:
+    names = []
+    for p in providers:
+        if isinstance(p, tuple):
+            name = p[0]
+        else:
+            name = p
+        if name in available_providers:
+            names.append(name)
+    return names
+
+
+def convert_weights_to_fp16(weights_path: str, fp16_weights_path: str) -> None:
+    import onnx
+    from onnxruntime.transformers.float16 import convert_float_to_float16
+
+    model = convert_float_to_float16(onnx.load(weights_path), keep_io_types=True)
+    # written aside and moved, so concurrent loads never see a partial file
+    tmp_path = f"{fp16_weights_path}.tmp"
+    onnx.save(model, tmp_path)
+    os.replace(tmp_path, fp16_weights_path)
+
+
+def quantize_weights_to_int8(weights_path: str, int8_weights_path: str) -> None:
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    tmp_path = f"{int8_weights_path}.tmp"
+    quantize_dynamic(weights_path, tmp_path, weight_type=QuantType.QInt8)
+    os.replace(tmp_path, int8_weights_path)
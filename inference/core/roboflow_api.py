@@ -1,11 +1,17 @@
 import json
+import os
+import threading
+import time
 import urllib.parse
 from enum import Enum
+from functools import wraps
 from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
 
 import requests
 from requests import Response
+from requests.adapters import HTTPAdapter
 from requests_toolbelt import MultipartEncoder
+from urllib3.util.retry import Retry
 
 from inference.core import logger
 from inference.core.cache import cache
@@ -16,7 +22,14 @@ from inference.core.entities.types import (
     VersionID,
     WorkspaceID,
 )
-from inference.core.env import API_BASE_URL
+from inference.core.env import (
+    API_BASE_URL,
+    API_CONNECT_TIMEOUT,
+    API_POOL_MAXSIZE,
+    API_READ_TIMEOUT,
+    ROBOFLOW_CACHE_FALLBACK,
+    ROBOFLOW_METADATA_TTL_SECONDS,
+)
 from inference.core.exceptions import (
     MalformedRoboflowAPIResponseError,
     MalformedWorkflowResponseError,
@@ -30,6 +43,7 @@ from inference.core.exceptions import (
     RoboflowAPIUnsuccessfulRequestError,
     WorkspaceLoadError,
 )
+from inference.core.utils.file_system import ensure_parent_dir_exists
 from inference.core.utils.requests import api_key_safe_raise_for_status
 from inference.core.utils.url_utils import wrap_url
 
@@ -40,7 +54,10 @@ MODEL_TYPE_DEFAULTS = {
     "keypoint-detection": "yolov8n",
 }
 PROJECT_TASK_TYPE_KEY = "project_task_type"
+DOWNLOAD_CHUNK_SIZE = 4 * 1024 * 1024
 MODEL_TYPE_KEY = "model_type"
+API_REQUEST_TIMEOUT = (API_CONNECT_TIMEOUT, API_READ_TIMEOUT)
+METADATA_CACHE_MAX_SIZE = 1024
 
 NOT_FOUND_ERROR_MESSAGE = (
     "Could not find requested Roboflow resource. Check that the provided dataset and "
@@ -48,6 +65,31 @@ NOT_FOUND_ERROR_MESSAGE = (
 )
 
 
+def _create_api_session() -> requests.Session:
+    # retries are restricted to idempotent methods; raise_on_status=False hands the
+    # last response back, so api_key_safe_raise_for_status() still reports the error.
+    # HTTP 500 is not retried - API uses it to signal e.g. non-existing model version.
+    # Retry-After is ignored, as it could hold request thread for unbounded time.
+    retry = Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=(429, 502, 503, 504),
+        raise_on_status=False,
+        respect_retry_after_header=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=16, pool_maxsize=API_POOL_MAXSIZE, max_retries=retry
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["Connection"] = "keep-alive"
+    return session
+
+
+_SESSION = _create_api_session()
+
+
 def raise_from_lambda(
     inner_error: Exception, exception_type: Type[Exception], message: str
 ) -> None:
@@ -102,6 +144,70 @@ def wrap_roboflow_api_errors(
     return decorator
 
 
+_METADATA_CACHE: Dict[tuple, Tuple[float, Any]] = {}
+_METADATA_CACHE_LOCK = threading.Lock()
+
+
+def cached_with_ttl(
+    ttl_seconds: int = ROBOFLOW_METADATA_TTL_SECONDS,
+) -> callable:
+    def decorator(function: callable) -> callable:
+        @wraps(function)
+        def wrapper(*args, **kwargs) -> Any:
+            if ttl_seconds <= 0 and not ROBOFLOW_CACHE_FALLBACK:
+                return function(*args, **kwargs)
+            key = (function, args, tuple(sorted(kwargs.items())))
+            with _METADATA_CACHE_LOCK:
+                entry = _METADATA_CACHE.get(key)
+            if entry is not None and time.monotonic() - entry[0] < ttl_seconds:
+                return entry[1]
+            try:
+                result = function(*args, **kwargs)
+            except (
+                RoboflowAPIConnectionError,
+                RoboflowAPIUnsuccessfulRequestError,
+            ) as error:
+                if (
+                    not ROBOFLOW_CACHE_FALLBACK
+                    or entry is None
+                    or not _is_transient_api_error(error=error)
+                ):
+                    raise error
+                logger.warning(
+                    f"Roboflow API request failed ({error}) - using last known response for "
+                    f"{function.__name__}()."
+                )
+                return entry[1]
+            with _METADATA_CACHE_LOCK:
+                _METADATA_CACHE.pop(key, None)
+                if len(_METADATA_CACHE) >= METADATA_CACHE_MAX_SIZE:
+                    # dict keeps insertion order - the first entry is the oldest one
+                    del _METADATA_CACHE[next(iter(_METADATA_CACHE))]
+                _METADATA_CACHE[key] = (time.monotonic(), result)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def _is_transient_api_error(error: Exception) -> bool:
+    if isinstance(error, RoboflowAPIConnectionError):
+        return True
+    cause = error.__cause__
+    return (
+        isinstance(cause, requests.exceptions.HTTPError)
+        and cause.response is not None
+        and cause.response.status_code >= 500
+    )
+
+
+def clear_roboflow_metadata_cache() -> None:
+    with _METADATA_CACHE_LOCK:
+        _METADATA_CACHE.clear()
+
+
+@cached_with_ttl()
 @wrap_roboflow_api_errors()
 def get_roboflow_workspace(api_key: str) -> WorkspaceID:
     api_url = _add_params_to_url(
@@ -115,6 +221,7 @@ def get_roboflow_workspace(api_key: str) -> WorkspaceID:
     return workspace_id
 
 
+@cached_with_ttl()
 @wrap_roboflow_api_errors()
 def get_roboflow_dataset_type(
     api_key: str, workspace_id: WorkspaceID, dataset_id: DatasetID
@@ -133,6 +240,7 @@ def get_roboflow_dataset_type(
     return project_task_type.get("type", "object-detection")
 
 
+@cached_with_ttl()
 @wrap_roboflow_api_errors(
     http_errors_handlers={
         500: lambda e: raise_from_lambda(
@@ -154,16 +262,17 @@ def get_roboflow_model_type(
         params=[("api_key", api_key), ("nocache", "true")],
     )
     version_info = _get_from_url(url=api_url)
-    model_type = version_info["version"]
-    if "modelType" not in model_type:
-        if project_task_type not in MODEL_TYPE_DEFAULTS:
-            raise MissingDefaultModelError(
-                f"Could not set default model for {project_task_type}"
-            )
-        logger.warning(
-            f"Model type not defined - using default for {project_task_type} task."
+    model_type = version_info["version"].get("modelType")
+    if model_type is not None:
+        return model_type
+    if project_task_type not in MODEL_TYPE_DEFAULTS:
+        raise MissingDefaultModelError(
+            f"Could not set default model for {project_task_type}"
         )
-    return model_type.get("modelType", MODEL_TYPE_DEFAULTS[project_task_type])
+    logger.warning(
+        f"Model type not defined - using default for {project_task_type} task."
+    )
+    return MODEL_TYPE_DEFAULTS[project_task_type]
 
 
 class ModelEndpointType(Enum):
@@ -171,6 +280,8 @@ class ModelEndpointType(Enum):
     CORE_MODEL = "core_model"
 
 
+# model data is always fetched fresh, entries are only kept to serve as fallback
+@cached_with_ttl(ttl_seconds=0)
 @wrap_roboflow_api_errors()
 def get_roboflow_model_data(
     api_key: str,
@@ -354,13 +465,29 @@ def get_from_url(
 
 
 def _get_from_url(url: str, json_response: bool = True) -> Union[Response, dict]:
-    response = requests.get(wrap_url(url))
+    response = _SESSION.get(wrap_url(url), timeout=API_REQUEST_TIMEOUT)
     api_key_safe_raise_for_status(response=response)
     if json_response:
         return response.json()
     return response
 
 
+@wrap_roboflow_api_errors()
+def download_file_from_url(url: str, target_path: str) -> None:
+    # weights are streamed in chunks, so large models are never held in memory
+    with _SESSION.get(
+        wrap_url(url), stream=True, timeout=API_REQUEST_TIMEOUT
+    ) as response:
+        api_key_safe_raise_for_status(response=response)
+        ensure_parent_dir_exists(path=target_path)
+        # partial file must not look like cached artefact if download is interrupted
+        tmp_path = f"{target_path}.part"
+        with open(tmp_path, "wb") as f:
+            for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                f.write(chunk)
+        os.replace(tmp_path, target_path)
+
+
 def _add_params_to_url(url: str, params: List[Tuple[str, str]]) -> str:
     if len(params) == 0:
         return url
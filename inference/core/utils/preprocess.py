@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
 
 import cv2
 import numpy as np
@@ -9,6 +9,8 @@ from inference.core.env import (
     DISABLE_PREPROC_CONTRAST,
     DISABLE_PREPROC_GRAYSCALE,
     DISABLE_PREPROC_STATIC_CROP,
+    PREPROC_OPENCL_ENABLED,
+    PREPROC_OPENCL_MIN_PIXELS,
 )
 from inference.core.exceptions import PreProcessingError
 
@@ -17,6 +19,7 @@ CONTRAST_KEY = "contrast"
 GRAYSCALE_KEY = "grayscale"
 ENABLED_KEY = "enabled"
 TYPE_KEY = "type"
+OPENCL_RESIZE_AVAILABLE = PREPROC_OPENCL_ENABLED and cv2.ocl.haveOpenCL()
 
 
 class ContrastAdjustmentType(Enum):
@@ -192,18 +195,20 @@ def letterbox_image(
     )
     new_height, new_width = resized_img.shape[:2]
     top_padding = (desired_size[1] - new_height) // 2
-    bottom_padding = desired_size[1] - new_height - top_padding
     left_padding = (desired_size[0] - new_width) // 2
-    right_padding = desired_size[0] - new_width - left_padding
-    return cv2.copyMakeBorder(
-        resized_img,
-        top_padding,
-        bottom_padding,
-        left_padding,
-        right_padding,
-        cv2.BORDER_CONSTANT,
-        value=color,
+    bottom, right = top_padding + new_height, left_padding + new_width
+    letterboxed_img = np.empty(
+        (desired_size[1], desired_size[0]) + resized_img.shape[2:],
+        dtype=resized_img.dtype,
     )
+    # only padding strips are filled, resized content is copied once into the centre
+    padding_value = color[0] if resized_img.ndim == 2 else color
+    letterboxed_img[:top_padding] = padding_value
+    letterboxed_img[bottom:] = padding_value
+    letterboxed_img[top_padding:bottom, :left_padding] = padding_value
+    letterboxed_img[top_padding:bottom, right:] = padding_value
+    letterboxed_img[top_padding:bottom, left_padding:right] = resized_img
+    return letterboxed_img
 
 
 def downscale_image_keeping_aspect_ratio(
@@ -240,4 +245,30 @@ def resize_image_keeping_aspect_ratio(
         new_width = int(desired_size[1] * img_ratio)
 
     # Resize the image to new dimensions
-    return cv2.resize(image, (new_width, new_height))
+    return resize_image(image=image, size=(new_width, new_height))
+
+
+def resize_image(
+    image: np.ndarray,
+    size: Tuple[int, int],
+    interpolation: int = cv2.INTER_LINEAR,
+    dst: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Resize image, offloading large images to OpenCL device when enabled and available.
+
+    Parameters:
+    - image: numpy array representing the image.
+    - size: tuple (width, height) representing the target dimensions.
+    - interpolation: OpenCV interpolation flag.
+    - dst: optional buffer to resize into on CPU path, reallocated by OpenCV if shape or dtype do not match.
+
+    Returns:
+    - resized image.
+    """
+    if (
+        OPENCL_RESIZE_AVAILABLE
+        and image.shape[0] * image.shape[1] >= PREPROC_OPENCL_MIN_PIXELS
+    ):
+        return cv2.resize(cv2.UMat(image), size, interpolation=interpolation).get()
+    return cv2.resize(image, size, dst=dst, interpolation=interpolation)
@@ -1,6 +1,7 @@
 import os
-from typing import List
+from typing import List, Optional
 
+from boto3.s3.transfer import TransferConfig
 from botocore.client import BaseClient
 
 
@@ -9,12 +10,17 @@ def download_s3_files_to_directory(
     keys: List[str],
     target_dir: str,
     s3_client: BaseClient,
+    transfer_config: Optional[TransferConfig] = None,
 ) -> None:
     os.makedirs(target_dir, exist_ok=True)
+    download_kwargs = {}
+    if transfer_config is not None:
+        download_kwargs["Config"] = transfer_config
     for key in keys:
         target_path = os.path.join(target_dir, key)
         s3_client.download_file(
             bucket,
             key,
             target_path,
+            **download_kwargs,
         )
@@ -18,6 +18,8 @@ from inference.core.entities.responses.inference import (
 )
 from inference.core.utils.image_utils import encode_image_to_jpeg_bytes, load_image_rgb
 
+DEFAULT_COLOR = (72, 146, 234)
+
 
 def draw_detection_predictions(
     inference_request: Union[
@@ -30,13 +32,11 @@ def draw_detection_predictions(
         InstanceSegmentationPrediction,
         KeypointsPrediction,
     ],
-    colors: Dict[str, str],
+    colors: Dict[str, Tuple[int, int, int]],
 ) -> bytes:
     image = load_image_rgb(inference_request.image)
     for box in inference_response.predictions:
-        color = tuple(
-            int(colors.get(box.class_name, "#4892EA")[i : i + 2], 16) for i in (1, 3, 5)
-        )
+        color = colors.get(box.class_name, DEFAULT_COLOR)
         image = draw_bbox(
             image=image,
             box=box,
@@ -128,23 +128,33 @@ def draw_labels(
     (text_width, text_height), _ = cv2.getTextSize(
         text, cv2.FONT_HERSHEY_SIMPLEX, 0.5, 1
     )
-    button_size = (text_width + 20, text_height + 20)
-    button_img = np.full(
-        (button_size[1], button_size[0], 3), color[::-1], dtype=np.uint8
+    image = cv2.rectangle(
+        image,
+        (x1, y1),
+        (x1 + text_width + 20, y1 + text_height + 20),
+        color=color,
+        thickness=-1,
     )
-    cv2.putText(
-        button_img,
+    return cv2.putText(
+        image,
         text,
-        (10, 10 + text_height),
+        (x1 + 10, y1 + 10 + text_height),
         cv2.FONT_HERSHEY_SIMPLEX,
         0.5,
         (255, 255, 255),
         1,
     )
-    end_x = min(x1 + button_size[0], image.shape[1])
-    end_y = min(y1 + button_size[1], image.shape[0])
-    image[y1:end_y, x1:end_x] = button_img[: end_y - y1, : end_x - x1]
-    return image
+
+
+def hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
+    # colours come from project settings - malformed value must not break model loading
+    try:
+        rgb = tuple(bytes.fromhex(hex_color.lstrip("#"))[:3])
+    except (AttributeError, TypeError, ValueError):
+        return DEFAULT_COLOR
+    if len(rgb) != 3:
+        return DEFAULT_COLOR
+    return rgb
 
 
 def bbox_to_points(
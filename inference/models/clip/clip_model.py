@@ -25,10 +25,10 @@ from inference.core.env import (
     REQUIRED_ONNX_PROVIDERS,
     TENSORRT_CACHE_PATH,
 )
-from inference.core.exceptions import OnnxProviderNotAvailable
 from inference.core.models.roboflow import OnnxRoboflowCoreModel
 from inference.core.models.types import PreprocessReturnMetadata
 from inference.core.models.utils.batching import create_batches
+from inference.core.models.utils.onnx import validate_required_providers_available
 from inference.core.utils.image_utils import load_image_rgb
 from inference.core.utils.onnx import get_onnxruntime_execution_providers
 from inference.core.utils.postprocess import cosine_similarity
@@ -73,12 +73,7 @@ class Clip(OnnxRoboflowCoreModel):
         )
 
         if REQUIRED_ONNX_PROVIDERS:
-            available_providers = onnxruntime.get_available_providers()
-            for provider in REQUIRED_ONNX_PROVIDERS:
-                if provider not in available_providers:
-                    raise OnnxProviderNotAvailable(
-                        f"Required ONNX Execution Provider {provider} is not availble. Check that you are using the correct docker image on a supported device."
-                    )
+            validate_required_providers_available(REQUIRED_ONNX_PROVIDERS)
 
         self.resolution = self.visual_onnx_session.get_inputs()[0].shape[2]
 
@@ -1,21 +1,104 @@
+import importlib.util
 import os
 import shutil
-import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from time import perf_counter
-from typing import Any, List, Union
+from typing import Any, Dict, List, Tuple, Union
 
-from doctr import models as models
-from doctr.io import DocumentFile
-from doctr.models import ocr_predictor
+import numpy as np
 from PIL import Image
 
+from inference.core import logger
 from inference.core.entities.requests.doctr import DoctrOCRInferenceRequest
 from inference.core.entities.requests.inference import InferenceRequest
 from inference.core.entities.responses.doctr import DoctrOCRInferenceResponse
 from inference.core.entities.responses.inference import InferenceResponse
-from inference.core.env import MODEL_CACHE_DIR
-from inference.core.models.roboflow import RoboflowCoreModel
-from inference.core.utils.image_utils import load_image
+from inference.core.env import DOCTR_WARMUP_ENABLED, MODEL_CACHE_DIR
+from inference.core.models.roboflow import IMAGE_LOADER_THREADPOOL, RoboflowCoreModel
+from inference.core.utils.image_utils import load_image_rgb
+
+# doctr pulls in torch on import, so it is only imported once a predictor is built -
+# checking for the package keeps DocTR unregistered when doctr is not installed
+if importlib.util.find_spec("doctr") is None:
+    raise ModuleNotFoundError("DocTR model requires `doctr` package to be installed.")
+
+_OCR_PREDICTORS: Dict[Tuple[str, str], Any] = {}
+_OCR_PREDICTORS_LOCK = threading.Lock()
+
+
+def get_ocr_predictor(det_arch: str, reco_arch: str) -> Any:
+    """Returns doctr OCR predictor for given architectures, building it only once per process.
+
+    Args:
+        det_arch (str): Detection architecture, e.g. "db_resnet50".
+        reco_arch (str): Recognition architecture, e.g. "crnn_vgg16_bn".
+
+    Returns:
+        Any: The doctr OCR predictor.
+    """
+    key = (det_arch, reco_arch)
+    with _OCR_PREDICTORS_LOCK:
+        if key not in _OCR_PREDICTORS:
+            from doctr.models import ocr_predictor
+
+            _stage_doctr_weights()
+            predictor = ocr_predictor(
+                det_arch=det_arch,
+                reco_arch=reco_arch,
+                pretrained=True,
+            )
+            if DOCTR_WARMUP_ENABLED:
+                _warm_up_ocr_predictor(predictor=predictor)
+            _OCR_PREDICTORS[key] = predictor
+        return _OCR_PREDICTORS[key]
+
+
+def _warm_up_ocr_predictor(predictor: Any) -> None:
+    # first forward pass pays for kernel selection and allocator growth - it should
+    # happen at model load, not in the first user request
+    import torch
+
+    try:
+        with torch.inference_mode():
+            _ = predictor([np.zeros((64, 64, 3), dtype=np.uint8)])
+    except Exception as error:
+        logger.warning(f"DocTR warmup failed: {error}")
+
+
+def _stage_doctr_weights() -> None:
+    # doctr looks for pretrained weights under its own file names
+    os.makedirs(f"{MODEL_CACHE_DIR}/doctr_rec/models/", exist_ok=True)
+    os.makedirs(f"{MODEL_CACHE_DIR}/doctr_det/models/", exist_ok=True)
+    for src, dst in [
+        (
+            f"{MODEL_CACHE_DIR}/doctr_det/db_resnet50/model.pt",
+            f"{MODEL_CACHE_DIR}/doctr_det/models/db_resnet50-ac60cadc.pt",
+        ),
+        (
+            f"{MODEL_CACHE_DIR}/doctr_rec/crnn_vgg16_bn/model.pt",
+            f"{MODEL_CACHE_DIR}/doctr_rec/models/crnn_vgg16_bn-9762b0b0.pt",
+        ),
+    ]:
+        _stage_weight(src=src, dst=dst)
+
+
+def _stage_weight(src: str, dst: str) -> None:
+    if os.path.exists(dst):
+        return None
+    if os.path.islink(dst):
+        # symlink left dangling after source weights were removed from cache
+        os.remove(dst)
+    # doctr only reads staged weights, so linking avoids copying hundreds of MB
+    try:
+        os.link(src, dst)
+        return None
+    except OSError:
+        pass
+    try:
+        os.symlink(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
 
 
 class DocTR(RoboflowCoreModel):
@@ -34,29 +117,24 @@ class DocTR(RoboflowCoreModel):
 
         os.environ["DOCTR_CACHE_DIR"] = os.path.join(MODEL_CACHE_DIR, "doctr_rec")
 
-        self.det_model = DocTRDet(api_key=kwargs.get("api_key"))
-        self.rec_model = DocTRRec(api_key=kwargs.get("api_key"))
+        # both sub-models only fetch metadata and weights, so they can be loaded concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            det_model_future = executor.submit(DocTRDet, api_key=kwargs.get("api_key"))
+            rec_model_future = executor.submit(DocTRRec, api_key=kwargs.get("api_key"))
+            self.det_model = det_model_future.result()
+            self.rec_model = rec_model_future.result()
 
-        os.makedirs(f"{MODEL_CACHE_DIR}/doctr_rec/models/", exist_ok=True)
-        os.makedirs(f"{MODEL_CACHE_DIR}/doctr_det/models/", exist_ok=True)
-
-        shutil.copyfile(
-            f"{MODEL_CACHE_DIR}/doctr_det/db_resnet50/model.pt",
-            f"{MODEL_CACHE_DIR}/doctr_det/models/db_resnet50-ac60cadc.pt",
-        )
-        shutil.copyfile(
-            f"{MODEL_CACHE_DIR}/doctr_rec/crnn_vgg16_bn/model.pt",
-            f"{MODEL_CACHE_DIR}/doctr_rec/models/crnn_vgg16_bn-9762b0b0.pt",
-        )
-
-        self.model = ocr_predictor(
+        self.model = get_ocr_predictor(
             det_arch=self.det_model.version_id,
             reco_arch=self.rec_model.version_id,
-            pretrained=True,
         )
         self.task_type = "ocr"
 
     def clear_cache(self) -> None:
+        with _OCR_PREDICTORS_LOCK:
+            _OCR_PREDICTORS.pop(
+                (self.det_model.version_id, self.rec_model.version_id), None
+            )
         self.det_model.clear_cache()
         self.rec_model.clear_cache()
 
@@ -82,6 +160,7 @@ class DocTR(RoboflowCoreModel):
         """
         Run inference on a provided image.
             - image: can be a BGR numpy array, filepath, InferenceRequestImage, PIL Image, byte-string, etc.
+              or a list of those - pages of one document, recognised in a single batched forward pass.
 
         Args:
             request (DoctrOCRInferenceRequest): The inference request.
@@ -89,29 +168,26 @@ class DocTR(RoboflowCoreModel):
         Returns:
             DoctrOCRInferenceResponse: The inference response.
         """
-
-        img = load_image(image)
-
-        with tempfile.NamedTemporaryFile(suffix=".jpg") as f:
-            image = Image.fromarray(img[0])
-
-            image.save(f.name)
-
-            doc = DocumentFile.from_images([f.name])
-
-            result = self.model(doc).export()
-
-            result = result["pages"][0]["blocks"]
-
-            result = [
-                " ".join([word["value"] for word in line["words"]])
-                for block in result
-                for line in block["lines"]
-            ]
-
-            result = " ".join(result)
-
-            return result
+        import torch
+
+        images = image if isinstance(image, list) else [image]
+        # doctr predictor accepts RGB pages as numpy arrays - no need to round-trip
+        # the image through a temporary JPEG file
+        if len(images) > 1:
+            pages = list(IMAGE_LOADER_THREADPOOL.map(load_image_rgb, images))
+        else:
+            pages = [load_image_rgb(images[0])]
+
+        with torch.inference_mode():
+            result = self.model(pages).export()
+
+        return " ".join(
+            word["value"]
+            for page in result["pages"]
+            for block in page["blocks"]
+            for line in block["lines"]
+            for word in line["words"]
+        )
 
     def get_infer_bucket_file_list(self) -> list:
         """Get the list of required files for inference.
@@ -130,10 +206,6 @@ class DocTRRec(RoboflowCoreModel):
             *args: Variable length argument list.
             **kwargs: Arbitrary keyword arguments.
         """
-        pass
-
-        self.get_infer_bucket_file_list()
-
         super().__init__(*args, model_id=model_id, **kwargs)
 
     def get_infer_bucket_file_list(self) -> list:
@@ -160,9 +232,6 @@ class DocTRDet(RoboflowCoreModel):
             *args: Variable length argument list.
             **kwargs: Arbitrary keyword arguments.
         """
-
-        self.get_infer_bucket_file_list()
-
         super().__init__(*args, model_id=model_id, **kwargs)
 
     def get_infer_bucket_file_list(self) -> list:
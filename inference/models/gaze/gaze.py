@@ -26,8 +26,8 @@ from inference.core.env import (
     REQUIRED_ONNX_PROVIDERS,
     TENSORRT_CACHE_PATH,
 )
-from inference.core.exceptions import OnnxProviderNotAvailable
 from inference.core.models.roboflow import OnnxRoboflowCoreModel
+from inference.core.models.utils.onnx import validate_required_providers_available
 from inference.core.utils.image_utils import load_image_rgb
 from inference.models.gaze.l2cs import L2CS
 
@@ -69,12 +69,7 @@ class Gaze(OnnxRoboflowCoreModel):
         )
 
         if REQUIRED_ONNX_PROVIDERS:
-            available_providers = onnxruntime.get_available_providers()
-            for provider in REQUIRED_ONNX_PROVIDERS:
-                if provider not in available_providers:
-                    raise OnnxProviderNotAvailable(
-                        f"Required ONNX Execution Provider {provider} is not availble. Check that you are using the correct docker image on a supported device."
-                    )
+            validate_required_providers_available(REQUIRED_ONNX_PROVIDERS)
 
         # init face detector
         self.face_detector = mp.tasks.vision.FaceDetector.create_from_options(
@@ -16,7 +16,6 @@ from typing import Any, List, Tuple, Union
 import torch
 from PIL import Image
 
-from inference.core.cache.model_artifacts import save_bytes_in_cache
 from inference.core.entities.requests.inference import LMMInferenceRequest
 from inference.core.entities.responses.inference import (
     InferenceResponseImage,
@@ -29,7 +28,7 @@ from inference.core.models.base import PreprocessReturnMetadata
 from inference.core.models.roboflow import RoboflowInferenceModel
 from inference.core.roboflow_api import (
     ModelEndpointType,
-    get_from_url,
+    download_file_from_url,
     get_roboflow_model_data,
 )
 from inference.core.utils.image_utils import load_image_rgb
@@ -125,11 +124,8 @@ class PaliGemma(RoboflowInferenceModel):
             filename = weights_url.split("?")[0].split("/")[-1]
             if filename.endswith(".npz"):
                 continue
-            model_weights_response = get_from_url(weights_url, json_response=False)
-            save_bytes_in_cache(
-                content=model_weights_response.content,
-                file=filename,
-                model_id=self.endpoint,
+            download_file_from_url(
+                url=weights_url, target_path=self.cache_file(filename)
             )
             if perf_counter() - t1 > 120:
                 logger.debug(
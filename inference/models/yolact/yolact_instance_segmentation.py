@@ -105,7 +105,7 @@ class YOLACT(OnnxRoboflowInferenceModel):
         mean = (103.94, 116.78, 123.68)
         std = (57.38, 57.12, 58.40)
 
-        img_in = img_in.astype(np.float32)
+        img_in = img_in.astype(np.float32, copy=False)
 
         # Our channels are RGB, so apply mean and std accordingly
         img_in[:, 0, :, :] = (img_in[:, 0, :, :] - mean[2]) / std[2]
@@ -122,7 +122,7 @@ class YOLACT(OnnxRoboflowInferenceModel):
     def predict(
         self, img_in: np.ndarray, **kwargs
     ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
-        return self.onnx_session.run(None, {self.input_name: img_in})
+        return self.run_onnx_session(img_in)
 
     def postprocess(
         self,
@@ -1,18 +1,28 @@
 import json
-from typing import Optional
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Optional
 from unittest import mock
 from unittest.mock import MagicMock
 
+import cv2
+import numpy as np
 import pytest
 
 from inference.core.exceptions import ModelArtefactError
 from inference.core.models import roboflow
 from inference.core.models.roboflow import (
+    OnnxRoboflowInferenceModel,
+    _fuse_resize_to_nchw,
+    _get_resize_buffer,
     class_mapping_not_available_in_environment,
     color_mapping_available_in_environment,
     get_class_names_from_environment_file,
     get_color_mapping_from_environment,
+    get_optimized_weights_file,
     is_model_artefacts_bucket_available,
+    is_optimized_model_up_to_date,
 )
 
 
@@ -194,3 +204,736 @@ def test_get_class_names_from_environment_file() -> None:
         "class_k",
         "class_l",
     ]
+
+
+@pytest.mark.parametrize("is_bgr", [True, False])
+def test_fuse_resize_to_nchw(is_bgr: bool) -> None:
+    # given
+    image = np.random.randint(0, 255, size=(32, 48, 3), dtype=np.uint8)
+    out = np.empty((1, 3, 32, 48), dtype=np.float32)
+    source = cv2.cvtColor(image, cv2.COLOR_BGR2RGB) if is_bgr else image
+    expected_result = np.expand_dims(
+        np.transpose(source, (2, 0, 1)).astype(np.float32), axis=0
+    )
+
+    # when
+    _fuse_resize_to_nchw(image, out, is_bgr)
+
+    # then
+    assert np.array_equal(out, expected_result)
+
+
+def test_fuse_resize_to_nchw_when_called_from_worker_threads() -> None:
+    # given
+    images = [
+        np.random.randint(0, 255, size=(32, 48, 3), dtype=np.uint8) for _ in range(8)
+    ]
+    out = np.empty((len(images), 3, 32, 48), dtype=np.float32)
+
+    def fuse(i: int) -> None:
+        _fuse_resize_to_nchw(images[i], out[i : i + 1], True)
+
+    # when
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(fuse, range(len(images))))
+
+    # then
+    for i, image in enumerate(images):
+        expected_result = np.transpose(
+            cv2.cvtColor(image, cv2.COLOR_BGR2RGB), (2, 0, 1)
+        )
+        assert np.array_equal(out[i], expected_result.astype(np.float32))
+
+
+def test_is_optimized_model_up_to_date_when_optimized_model_not_cached(
+    empty_local_dir: str,
+) -> None:
+    # given
+    weights_path = os.path.join(empty_local_dir, "weights.onnx")
+    with open(weights_path, "wb") as f:
+        f.write(b"weights")
+
+    # when
+    result = is_optimized_model_up_to_date(
+        weights_path=weights_path,
+        optimized_weights_path=os.path.join(empty_local_dir, "weights.optimized.onnx"),
+    )
+
+    # then
+    assert result is False
+
+
+def test_is_optimized_model_up_to_date_when_weights_are_newer(
+    empty_local_dir: str,
+) -> None:
+    # given
+    weights_path = os.path.join(empty_local_dir, "weights.onnx")
+    optimized_weights_path = os.path.join(empty_local_dir, "weights.optimized.onnx")
+    for path in [weights_path, optimized_weights_path]:
+        with open(path, "wb") as f:
+            f.write(b"weights")
+    os.utime(optimized_weights_path, (1000, 1000))
+
+    # when
+    result = is_optimized_model_up_to_date(
+        weights_path=weights_path,
+        optimized_weights_path=optimized_weights_path,
+    )
+
+    # then
+    assert result is False
+
+
+def test_is_optimized_model_up_to_date_when_optimized_model_is_fresh(
+    empty_local_dir: str,
+) -> None:
+    # given
+    weights_path = os.path.join(empty_local_dir, "weights.onnx")
+    optimized_weights_path = os.path.join(empty_local_dir, "weights.optimized.onnx")
+    for path in [weights_path, optimized_weights_path]:
+        with open(path, "wb") as f:
+            f.write(b"weights")
+    os.utime(weights_path, (1000, 1000))
+
+    # when
+    result = is_optimized_model_up_to_date(
+        weights_path=weights_path,
+        optimized_weights_path=optimized_weights_path,
+    )
+
+    # then
+    assert result is True
+
+
+def _model_with_mocked_session(io_binding_enabled: bool) -> OnnxRoboflowInferenceModel:
+    model = OnnxRoboflowInferenceModel.__new__(OnnxRoboflowInferenceModel)
+    model.endpoint = "some/1"
+    model.input_name = "images"
+    model.onnx_session = MagicMock()
+    model._io_binding_enabled = io_binding_enabled
+    model._io_binding_state = threading.local()
+    model._run_coalescer = None
+    return model
+
+
+def test_run_onnx_session_when_io_binding_is_disabled() -> None:
+    # given
+    model = _model_with_mocked_session(io_binding_enabled=False)
+    model.onnx_session.run.return_value = ["output"]
+    img_in = np.zeros((1, 3, 8, 8), dtype=np.float32)
+
+    # when
+    result = model.run_onnx_session(img_in)
+
+    # then
+    assert result == ["output"]
+    model.onnx_session.run.assert_called_once_with(None, {"images": img_in})
+    model.onnx_session.io_binding.assert_not_called()
+
+
+@mock.patch.object(roboflow.onnxruntime, "OrtValue")
+def test_run_onnx_session_when_io_binding_is_enabled(
+    ort_value_mock: MagicMock,
+) -> None:
+    # given
+    model = _model_with_mocked_session(io_binding_enabled=True)
+    output = MagicMock()
+    output.name = "output0"
+    model.onnx_session.get_outputs.return_value = [output]
+    io_binding = model.onnx_session.io_binding.return_value
+    io_binding.copy_outputs_to_cpu.return_value = ["output"]
+    first_input_value, second_input_value = MagicMock(), MagicMock()
+    first_input_value.shape.return_value = [1, 3, 8, 8]
+    second_input_value.shape.return_value = [2, 3, 8, 8]
+    ort_value_mock.ortvalue_from_numpy.side_effect = [
+        first_input_value,
+        second_input_value,
+    ]
+
+    # when
+    first_result = model.run_onnx_session(np.zeros((1, 3, 8, 8), dtype=np.float32))
+    _ = model.run_onnx_session(np.ones((1, 3, 8, 8), dtype=np.float32))
+    _ = model.run_onnx_session(np.zeros((2, 3, 8, 8), dtype=np.float32))
+
+    # then
+    assert first_result == ["output"]
+    model.onnx_session.run.assert_not_called()
+    model.onnx_session.io_binding.assert_called_once()
+    io_binding.bind_output.assert_called_once_with("output0", "cuda")
+    assert ort_value_mock.ortvalue_from_numpy.call_count == 2
+    first_input_value.update_inplace.assert_called_once()
+    assert io_binding.bind_ortvalue_input.call_args_list == [
+        mock.call("images", first_input_value),
+        mock.call("images", second_input_value),
+    ]
+    assert model.onnx_session.run_with_iobinding.call_count == 3
+
+
+def test_run_onnx_session_when_io_binding_is_used_from_different_threads() -> None:
+    # given
+    model = _model_with_mocked_session(io_binding_enabled=True)
+    model.onnx_session.get_outputs.return_value = []
+    model.onnx_session.io_binding.side_effect = lambda: MagicMock()
+
+    # when
+    with mock.patch.object(roboflow.onnxruntime, "OrtValue"):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            barrier = threading.Barrier(2)
+
+            def run(_: int) -> None:
+                barrier.wait()
+                model.run_onnx_session(np.zeros((1, 3, 8, 8), dtype=np.float32))
+
+            list(executor.map(run, range(2)))
+
+    # then
+    assert model.onnx_session.io_binding.call_count == 2
+
+
+def _model_with_mocked_artefacts(
+    infer_bucket_files: List[str],
+) -> OnnxRoboflowInferenceModel:
+    model = OnnxRoboflowInferenceModel.__new__(OnnxRoboflowInferenceModel)
+    model.endpoint = "some/1"
+    model.get_infer_bucket_file_list = lambda: list(infer_bucket_files)
+    return model
+
+
+@mock.patch.object(roboflow, "S3_CLIENT", MagicMock())
+@mock.patch.object(roboflow, "get_cache_dir", return_value="/some/cache")
+@mock.patch.object(roboflow, "TransferConfig", create=True)
+@mock.patch.object(roboflow, "download_s3_files_to_directory", create=True)
+def test_download_model_artefacts_from_s3_when_weights_file_given(
+    download_s3_files_to_directory_mock: MagicMock,
+    transfer_config_mock: MagicMock,
+    _: MagicMock,
+) -> None:
+    # given
+    model = _model_with_mocked_artefacts(["environment.json", "class_names.txt"])
+
+    # when
+    with mock.patch.object(
+        OnnxRoboflowInferenceModel,
+        "weights_file",
+        new_callable=mock.PropertyMock,
+        return_value="weights.onnx",
+    ):
+        model.download_model_artefacts_from_s3()
+
+    # then
+    assert download_s3_files_to_directory_mock.call_count == 2
+    other_files_call, weights_call = download_s3_files_to_directory_mock.call_args_list
+    assert other_files_call.kwargs["keys"] == [
+        "some/1/environment.json",
+        "some/1/class_names.txt",
+    ]
+    assert "transfer_config" not in other_files_call.kwargs
+    assert weights_call.kwargs["keys"] == ["some/1/weights.onnx"]
+    assert weights_call.kwargs["transfer_config"] is transfer_config_mock.return_value
+    transfer_config_mock.assert_called_once_with(
+        multipart_threshold=roboflow.S3_MULTIPART_CHUNK_SIZE,
+        multipart_chunksize=roboflow.S3_MULTIPART_CHUNK_SIZE,
+        max_concurrency=roboflow.S3_MAX_CONCURRENT_REQUESTS,
+    )
+
+
+@mock.patch.object(roboflow, "S3_CLIENT", MagicMock())
+@mock.patch.object(roboflow, "get_cache_dir", return_value="/some/cache")
+@mock.patch.object(roboflow, "TransferConfig", create=True)
+@mock.patch.object(roboflow, "download_s3_files_to_directory", create=True)
+def test_download_model_artefacts_from_s3_when_weights_file_not_given(
+    download_s3_files_to_directory_mock: MagicMock,
+    transfer_config_mock: MagicMock,
+    _: MagicMock,
+) -> None:
+    # given
+    model = _model_with_mocked_artefacts(["encoder.onnx", "decoder.onnx"])
+
+    # when
+    with mock.patch.object(
+        OnnxRoboflowInferenceModel,
+        "weights_file",
+        new_callable=mock.PropertyMock,
+        return_value=None,
+    ):
+        model.download_model_artefacts_from_s3()
+
+    # then
+    download_s3_files_to_directory_mock.assert_called_once()
+    call = download_s3_files_to_directory_mock.call_args
+    assert call.kwargs["keys"] == ["some/1/encoder.onnx", "some/1/decoder.onnx"]
+    assert "transfer_config" not in call.kwargs
+    transfer_config_mock.assert_not_called()
+
+
+def test_get_optimized_weights_file() -> None:
+    # when
+    result = get_optimized_weights_file(
+        weights_file="weights.fp16.onnx",
+        provider_names=["CUDAExecutionProvider", "CPUExecutionProvider"],
+    )
+
+    # then
+    assert (
+        result
+        == f"weights.fp16.optimized.ort{roboflow.onnxruntime.__version__}.cuda-cpu.onnx"
+    )
+
+
+def _model_for_session_initialisation(
+    cache_dir: str, providers: List[str]
+) -> OnnxRoboflowInferenceModel:
+    model = OnnxRoboflowInferenceModel.__new__(OnnxRoboflowInferenceModel)
+    model.endpoint = "some/1"
+    model.load_weights = True
+    model.onnxruntime_execution_providers = providers
+    model.preproc = {}
+    model.get_model_artifacts = MagicMock()
+    model.write_model_metadata_to_memcache = MagicMock()
+    model.cache_file = lambda f: os.path.join(cache_dir, f)
+    model._io_binding_enabled = False
+    model._io_binding_state = threading.local()
+    model._run_coalescer = None
+    with open(model.cache_file("weights.onnx"), "wb") as f:
+        f.write(b"weights")
+    return model
+
+
+def _initialise_model_with_mocked_session(
+    model: OnnxRoboflowInferenceModel, available_providers: List[str]
+) -> MagicMock:
+    with mock.patch.object(
+        roboflow,
+        "get_available_providers",
+        return_value=tuple(available_providers),
+    ), mock.patch.object(
+        roboflow.onnxruntime, "InferenceSession"
+    ) as inference_session_mock:
+        inference_session_mock.side_effect = _write_optimized_graph
+        inference_session_mock.return_value.get_inputs.return_value[0].shape = [
+            1,
+            3,
+            640,
+            640,
+        ]
+        model.initialize_model()
+    return inference_session_mock
+
+
+def _write_optimized_graph(*args, sess_options, **kwargs) -> Any:
+    if sess_options.optimized_model_filepath:
+        with open(sess_options.optimized_model_filepath, "wb") as f:
+            f.write(b"optimized")
+    return mock.DEFAULT
+
+
+def test_initialize_model_when_optimized_graph_not_cached(
+    empty_local_dir: str,
+) -> None:
+    # given
+    model = _model_for_session_initialisation(
+        cache_dir=empty_local_dir,
+        providers=["CUDAExecutionProvider", "CPUExecutionProvider"],
+    )
+    optimized_weights_path = model.cache_file(
+        get_optimized_weights_file("weights.onnx", ["CPUExecutionProvider"])
+    )
+
+    # when
+    inference_session_mock = _initialise_model_with_mocked_session(
+        model=model, available_providers=["CPUExecutionProvider"]
+    )
+
+    # then
+    serialising_call, serving_call = inference_session_mock.call_args_list
+    assert serialising_call.args[0] == os.path.join(empty_local_dir, "weights.onnx")
+    serialising_options = serialising_call.kwargs["sess_options"]
+    assert serialising_options.optimized_model_filepath.startswith(
+        optimized_weights_path
+    )
+    assert serialising_options.optimized_model_filepath.endswith(".tmp")
+    assert (
+        serialising_options.graph_optimization_level
+        == roboflow.onnxruntime.GraphOptimizationLevel.ORT_ENABLE_EXTENDED
+    )
+    assert serving_call.args[0] == optimized_weights_path
+    serving_options = serving_call.kwargs["sess_options"]
+    assert serving_options.optimized_model_filepath == ""
+    assert (
+        serving_options.graph_optimization_level
+        == roboflow.onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+    )
+    assert sorted(os.listdir(empty_local_dir)) == sorted(
+        ["weights.onnx", os.path.basename(optimized_weights_path)]
+    )
+
+
+def test_initialize_model_when_optimized_graph_cannot_be_serialised(
+    empty_local_dir: str,
+) -> None:
+    # given
+    model = _model_for_session_initialisation(
+        cache_dir=empty_local_dir,
+        providers=["CPUExecutionProvider"],
+    )
+
+    # when
+    with mock.patch.object(roboflow.os, "replace", side_effect=OSError("disk full")):
+        inference_session_mock = _initialise_model_with_mocked_session(
+            model=model, available_providers=["CPUExecutionProvider"]
+        )
+
+    # then
+    serving_call = inference_session_mock.call_args_list[-1]
+    assert serving_call.args[0] == os.path.join(empty_local_dir, "weights.onnx")
+    assert (
+        serving_call.kwargs["sess_options"].graph_optimization_level
+        == roboflow.onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+    )
+    assert os.listdir(empty_local_dir) == ["weights.onnx"]
+
+
+@mock.patch.object(roboflow, "LAMBDA", True)
+def test_initialize_model_when_running_on_lambda(empty_local_dir: str) -> None:
+    # given
+    model = _model_for_session_initialisation(
+        cache_dir=empty_local_dir,
+        providers=["CPUExecutionProvider"],
+    )
+
+    # when
+    inference_session_mock = _initialise_model_with_mocked_session(
+        model=model, available_providers=["CPUExecutionProvider"]
+    )
+
+    # then
+    assert inference_session_mock.call_count == 1
+    weights_path, session_options = (
+        inference_session_mock.call_args.args[0],
+        inference_session_mock.call_args.kwargs["sess_options"],
+    )
+    assert weights_path == os.path.join(empty_local_dir, "weights.onnx")
+    assert session_options.optimized_model_filepath == ""
+    assert (
+        session_options.graph_optimization_level
+        == roboflow.onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+    )
+
+
+def test_initialize_model_when_optimized_graph_cached_for_different_providers(
+    empty_local_dir: str,
+) -> None:
+    # given
+    model = _model_for_session_initialisation(
+        cache_dir=empty_local_dir,
+        providers=["CUDAExecutionProvider", "CPUExecutionProvider"],
+    )
+    with open(
+        model.cache_file(
+            get_optimized_weights_file("weights.onnx", ["CPUExecutionProvider"])
+        ),
+        "wb",
+    ) as f:
+        f.write(b"optimized")
+
+    # when
+    inference_session_mock = _initialise_model_with_mocked_session(
+        model=model,
+        available_providers=["CUDAExecutionProvider", "CPUExecutionProvider"],
+    )
+
+    # then
+    assert inference_session_mock.call_count == 2
+    assert inference_session_mock.call_args.args[0] == os.path.join(
+        empty_local_dir,
+        get_optimized_weights_file(
+            "weights.onnx", ["CUDAExecutionProvider", "CPUExecutionProvider"]
+        ),
+    )
+
+
+def test_initialize_model_when_optimized_graph_cached(empty_local_dir: str) -> None:
+    # given
+    model = _model_for_session_initialisation(
+        cache_dir=empty_local_dir,
+        providers=["CUDAExecutionProvider", "CPUExecutionProvider"],
+    )
+    optimized_weights_path = model.cache_file(
+        get_optimized_weights_file("weights.onnx", ["CPUExecutionProvider"])
+    )
+    with open(optimized_weights_path, "wb") as f:
+        f.write(b"optimized")
+
+    # when
+    inference_session_mock = _initialise_model_with_mocked_session(
+        model=model, available_providers=["CPUExecutionProvider"]
+    )
+
+    # then
+    weights_path, session_options = (
+        inference_session_mock.call_args.args[0],
+        inference_session_mock.call_args.kwargs["sess_options"],
+    )
+    assert weights_path == optimized_weights_path
+    assert session_options.optimized_model_filepath == ""
+    assert (
+        session_options.graph_optimization_level
+        == roboflow.onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+    )
+
+
+def test_initialize_model_when_tensorrt_is_used(empty_local_dir: str) -> None:
+    # given
+    model = _model_for_session_initialisation(
+        cache_dir=empty_local_dir,
+        providers=["TensorrtExecutionProvider", "CPUExecutionProvider"],
+    )
+
+    # when
+    inference_session_mock = _initialise_model_with_mocked_session(
+        model=model,
+        available_providers=["TensorrtExecutionProvider", "CPUExecutionProvider"],
+    )
+
+    # then
+    weights_path, session_options = (
+        inference_session_mock.call_args.args[0],
+        inference_session_mock.call_args.kwargs["sess_options"],
+    )
+    assert weights_path == os.path.join(empty_local_dir, "weights.onnx")
+    assert session_options.optimized_model_filepath == ""
+    assert (
+        session_options.graph_optimization_level
+        == roboflow.onnxruntime.GraphOptimizationLevel.ORT_DISABLE_ALL
+    )
+
+
+def test_initialize_model_when_compiling_provider_is_used(
+    empty_local_dir: str,
+) -> None:
+    # given
+    model = _model_for_session_initialisation(
+        cache_dir=empty_local_dir,
+        providers=["OpenVINOExecutionProvider", "CPUExecutionProvider"],
+    )
+
+    # when
+    inference_session_mock = _initialise_model_with_mocked_session(
+        model=model,
+        available_providers=["OpenVINOExecutionProvider", "CPUExecutionProvider"],
+    )
+
+    # then
+    weights_path, session_options = (
+        inference_session_mock.call_args.args[0],
+        inference_session_mock.call_args.kwargs["sess_options"],
+    )
+    assert weights_path == os.path.join(empty_local_dir, "weights.onnx")
+    assert session_options.optimized_model_filepath == ""
+    assert (
+        session_options.graph_optimization_level
+        == roboflow.onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+    )
+
+
+def test_load_image_when_batch_of_images_given() -> None:
+    # given
+    model = OnnxRoboflowInferenceModel.__new__(OnnxRoboflowInferenceModel)
+    model.img_size_h, model.img_size_w = 4, 6
+    model.image_loader_threadpool = ThreadPoolExecutor(max_workers=2)
+
+    def preproc_image(image: int, out: np.ndarray, **kwargs) -> tuple:
+        out[...] = image
+        return out, (image, image)
+
+    model.preproc_image = preproc_image
+
+    # when
+    img_in, img_dims = model.load_image([1, 2, 3])
+
+    # then
+    assert img_in.shape == (3, 3, 4, 6)
+    assert img_in.dtype == np.float32
+    for i, value in enumerate([1, 2, 3]):
+        assert np.all(img_in[i] == value)
+    assert img_dims == [(1, 1), (2, 2), (3, 3)]
+
+
+@mock.patch.object(roboflow, "convert_weights_to_fp16")
+def test_get_fp16_weights_path_when_fp16_weights_are_cached(
+    convert_weights_to_fp16_mock: MagicMock,
+    empty_local_dir: str,
+) -> None:
+    # given
+    model = _model_for_session_initialisation(
+        cache_dir=empty_local_dir, providers=["CUDAExecutionProvider"]
+    )
+    with open(model.cache_file("weights.fp16.onnx"), "wb") as f:
+        f.write(b"fp16")
+
+    # when
+    result = model.get_fp16_weights_path(weights_path=model.cache_file("weights.onnx"))
+
+    # then
+    assert result == model.cache_file("weights.fp16.onnx")
+    convert_weights_to_fp16_mock.assert_not_called()
+
+
+@mock.patch.object(roboflow, "convert_weights_to_fp16")
+def test_get_fp16_weights_path_when_conversion_fails(
+    convert_weights_to_fp16_mock: MagicMock,
+    empty_local_dir: str,
+) -> None:
+    # given
+    model = _model_for_session_initialisation(
+        cache_dir=empty_local_dir, providers=["CUDAExecutionProvider"]
+    )
+    convert_weights_to_fp16_mock.side_effect = ImportError("No module named 'onnx'")
+
+    # when
+    result = model.get_fp16_weights_path(weights_path=model.cache_file("weights.onnx"))
+
+    # then
+    assert result == model.cache_file("weights.onnx")
+    convert_weights_to_fp16_mock.assert_called_once_with(
+        model.cache_file("weights.onnx"), model.cache_file("weights.fp16.onnx")
+    )
+
+
+@pytest.mark.parametrize(
+    "available_providers, expected_weights_file",
+    [
+        (["CUDAExecutionProvider", "CPUExecutionProvider"], "weights.fp16.onnx"),
+        (
+            [
+                "TensorrtExecutionProvider",
+                "CUDAExecutionProvider",
+                "CPUExecutionProvider",
+            ],
+            "weights.onnx",
+        ),
+        (["CPUExecutionProvider"], "weights.onnx"),
+    ],
+)
+@mock.patch.object(roboflow, "ONNXRUNTIME_FP16_WEIGHTS", True)
+@mock.patch.object(roboflow, "convert_weights_to_fp16")
+def test_initialize_model_when_fp16_weights_enabled(
+    convert_weights_to_fp16_mock: MagicMock,
+    empty_local_dir: str,
+    available_providers: List[str],
+    expected_weights_file: str,
+) -> None:
+    # given
+    model = _model_for_session_initialisation(
+        cache_dir=empty_local_dir,
+        providers=[
+            "TensorrtExecutionProvider",
+            "CUDAExecutionProvider",
+            "CPUExecutionProvider",
+        ],
+    )
+
+    # when
+    inference_session_mock = _initialise_model_with_mocked_session(
+        model=model, available_providers=available_providers
+    )
+
+    # then
+    # first session is created from the weights - later one may load optimized graph
+    assert inference_session_mock.call_args_list[0].args[0] == model.cache_file(
+        expected_weights_file
+    )
+
+
+@pytest.mark.parametrize(
+    "load_weights, available_providers, expected_weights_file",
+    [
+        (True, ["CPUExecutionProvider"], "weights.int8.onnx"),
+        (False, ["CPUExecutionProvider"], "weights.onnx"),
+        (True, ["CUDAExecutionProvider", "CPUExecutionProvider"], "weights.onnx"),
+    ],
+)
+@mock.patch.object(roboflow, "ONNXRUNTIME_INT8_WEIGHTS", True)
+@mock.patch.object(roboflow, "quantize_weights_to_int8")
+def test_initialize_model_when_int8_weights_enabled(
+    quantize_weights_to_int8_mock: MagicMock,
+    empty_local_dir: str,
+    load_weights: bool,
+    available_providers: List[str],
+    expected_weights_file: str,
+) -> None:
+    # given
+    model = _model_for_session_initialisation(
+        cache_dir=empty_local_dir,
+        providers=["CUDAExecutionProvider", "CPUExecutionProvider"],
+    )
+    model.load_weights = load_weights
+
+    # when
+    inference_session_mock = _initialise_model_with_mocked_session(
+        model=model, available_providers=available_providers
+    )
+
+    # then
+    # first session is created from the weights - later one may load optimized graph
+    assert inference_session_mock.call_args_list[0].args[0] == model.cache_file(
+        expected_weights_file
+    )
+
+
+def test_get_all_required_infer_bucket_file_when_called_many_times() -> None:
+    # given
+    model = _model_with_mocked_artefacts(["environment.json", "class_names.txt"])
+    model.get_infer_bucket_file_list = MagicMock(
+        return_value=["environment.json", "class_names.txt"]
+    )
+
+    # when
+    first_result = model.get_all_required_infer_bucket_file()
+    first_result.append("other.txt")
+    second_result = model.get_all_required_infer_bucket_file()
+
+    # then
+    assert second_result == ["environment.json", "class_names.txt", "weights.onnx"]
+    model.get_infer_bucket_file_list.assert_called_once()
+
+
+def test_get_resize_buffer_when_called_from_different_threads() -> None:
+    # given
+    first_buffer = _get_resize_buffer(height=4, width=6, channels=3)
+
+    # when
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        other_thread_buffer = executor.submit(
+            _get_resize_buffer, height=4, width=6, channels=3
+        ).result()
+    second_buffer = _get_resize_buffer(height=4, width=6, channels=3)
+
+    # then
+    assert first_buffer.shape == (4, 6, 3)
+    assert first_buffer.dtype == np.uint8
+    assert second_buffer is first_buffer
+    assert other_thread_buffer is not first_buffer
+
+
+@pytest.mark.parametrize(
+    "io_binding_flag, session_providers, expected_result",
+    [
+        (False, ["CUDAExecutionProvider", "CPUExecutionProvider"], False),
+        (True, ["CPUExecutionProvider"], False),
+        (True, ["CUDAExecutionProvider", "CPUExecutionProvider"], True),
+    ],
+)
+def test_initialize_io_binding(
+    io_binding_flag: bool, session_providers: List[str], expected_result: bool
+) -> None:
+    # given
+    model = _model_with_mocked_session(io_binding_enabled=False)
+    model.onnx_session.get_providers.return_value = session_providers
+
+    # when
+    with mock.patch.object(roboflow, "ONNXRUNTIME_IO_BINDING_ENABLED", io_binding_flag):
+        model._initialize_io_binding()
+
+    # then
+    assert model._io_binding_enabled is expected_result
@@ -1,8 +1,11 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
 import numpy as np
+import pytest
 
-from inference.core.models.utils.batching import (
-    create_batches,
-)
+from inference.core.models.utils.batching import RunCoalescer, create_batches
 
 
 def test_create_batches_when_empty_sequence_given() -> None:
@@ -45,3 +48,165 @@ def test_create_batches_when_batch_size_multiplier_does_not_fir_sequence_length(
 
     # then
     assert result == [[1, 2, 3], [4]]
+
+
+def _run_concurrently(coalescer: RunCoalescer, inputs: List[np.ndarray]) -> list:
+    barrier = threading.Barrier(len(inputs))
+
+    def run(img_in: np.ndarray) -> List[np.ndarray]:
+        barrier.wait()
+        return coalescer.run(img_in)
+
+    with ThreadPoolExecutor(max_workers=len(inputs)) as executor:
+        return list(executor.map(run, inputs))
+
+
+def test_run_coalescer_when_concurrent_calls_fill_the_batch() -> None:
+    # given
+    batch_sizes = []
+
+    def run_batch(img_in: np.ndarray) -> List[np.ndarray]:
+        batch_sizes.append(img_in.shape[0])
+        return [img_in * 2, img_in[:, 0]]
+
+    coalescer = RunCoalescer(run_batch=run_batch, max_batch_size=3, max_wait_ms=5000)
+    inputs = [np.full((1, 3, 2, 2), i, dtype=np.float32) for i in range(3)]
+
+    # when
+    results = _run_concurrently(coalescer=coalescer, inputs=inputs)
+
+    # then
+    assert batch_sizes == [3]
+    for img_in, result in zip(inputs, results):
+        assert np.array_equal(result[0], img_in * 2)
+        assert np.array_equal(result[1], img_in[:, 0])
+
+
+def test_run_coalescer_when_single_call_waits_for_others() -> None:
+    # given
+    coalescer = RunCoalescer(
+        run_batch=lambda img_in: [img_in + 1], max_batch_size=8, max_wait_ms=1
+    )
+
+    # when
+    result = coalescer.run(np.zeros((2, 3, 2, 2), dtype=np.float32))
+
+    # then
+    assert len(result) == 1
+    assert np.array_equal(result[0], np.ones((2, 3, 2, 2), dtype=np.float32))
+
+
+def test_run_coalescer_when_outputs_are_not_batch_first() -> None:
+    # given
+    batch_sizes = []
+
+    def run_batch(img_in: np.ndarray) -> List[np.ndarray]:
+        batch_sizes.append(img_in.shape[0])
+        return [np.zeros((5,), dtype=np.float32) + img_in.sum()]
+
+    coalescer = RunCoalescer(run_batch=run_batch, max_batch_size=2, max_wait_ms=5000)
+    inputs = [np.full((1, 3, 2, 2), i, dtype=np.float32) for i in range(2)]
+
+    # when
+    results = _run_concurrently(coalescer=coalescer, inputs=inputs)
+    _ = coalescer.run(inputs[0])
+
+    # then
+    assert batch_sizes == [2, 1, 1, 1]
+    assert results[0][0][0] == 0
+    assert results[1][0][0] == 12
+
+
+def test_run_coalescer_when_batch_run_fails() -> None:
+    # given
+    def run_batch(img_in: np.ndarray) -> List[np.ndarray]:
+        raise RuntimeError("failure")
+
+    coalescer = RunCoalescer(run_batch=run_batch, max_batch_size=2, max_wait_ms=5000)
+
+    # when
+    with pytest.raises(RuntimeError):
+        _ = _run_concurrently(
+            coalescer=coalescer,
+            inputs=[np.zeros((1, 3, 2, 2), dtype=np.float32) for _ in range(2)],
+        )
+
+
+def test_run_coalescer_when_concurrent_calls_exceed_max_batch_size() -> None:
+    # given
+    batch_sizes = []
+
+    def run_batch(img_in: np.ndarray) -> List[np.ndarray]:
+        batch_sizes.append(img_in.shape[0])
+        return [img_in * 2]
+
+    coalescer = RunCoalescer(run_batch=run_batch, max_batch_size=4, max_wait_ms=5000)
+    inputs = [np.full((1, 3, 2, 2), i, dtype=np.float32) for i in range(12)]
+
+    # when
+    results = _run_concurrently(coalescer=coalescer, inputs=inputs)
+
+    # then
+    assert batch_sizes == [4, 4, 4]
+    for img_in, result in zip(inputs, results):
+        assert np.array_equal(result[0], img_in * 2)
+
+
+def test_run_coalescer_when_call_does_not_fit_into_pending_batch() -> None:
+    # given
+    batch_sizes = []
+
+    def run_batch(img_in: np.ndarray) -> List[np.ndarray]:
+        batch_sizes.append(img_in.shape[0])
+        return [img_in * 2]
+
+    coalescer = RunCoalescer(run_batch=run_batch, max_batch_size=4, max_wait_ms=20)
+    inputs = [np.zeros((3, 3, 2, 2), dtype=np.float32) for _ in range(2)] + [
+        np.zeros((4, 3, 2, 2), dtype=np.float32)
+    ]
+
+    # when
+    _ = _run_concurrently(coalescer=coalescer, inputs=inputs)
+
+    # then
+    assert sorted(batch_sizes) == [3, 3, 4]
+
+
+class _UnsliceableArray(np.ndarray):
+    def __getitem__(self, item):
+        raise IndexError("cannot slice")
+
+
+def test_run_coalescer_when_splitting_outputs_fails() -> None:
+    # given
+    def run_batch(img_in: np.ndarray) -> List[np.ndarray]:
+        return [np.zeros((img_in.shape[0], 2)).view(_UnsliceableArray)]
+
+    coalescer = RunCoalescer(run_batch=run_batch, max_batch_size=2, max_wait_ms=5000)
+
+    # when
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(
+            _run_concurrently,
+            coalescer=coalescer,
+            inputs=[np.zeros((1, 3, 2, 2), dtype=np.float32) for _ in range(2)],
+        )
+
+        # then
+        with pytest.raises(IndexError):
+            _ = future.result(timeout=10)
+
+
+def test_run_coalescer_when_outputs_are_not_arrays() -> None:
+    # given
+    def run_batch(img_in: np.ndarray) -> list:
+        return [[float(img_in.sum())]]
+
+    coalescer = RunCoalescer(run_batch=run_batch, max_batch_size=2, max_wait_ms=5000)
+    inputs = [np.full((1, 3, 2, 2), i, dtype=np.float32) for i in range(2)]
+
+    # when
+    results = _run_concurrently(coalescer=coalescer, inputs=inputs)
+
+    # then
+    assert results == [[[0.0]], [[12.0]]]
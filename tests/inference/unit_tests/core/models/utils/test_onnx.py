@@ -0,0 +1,101 @@
+from unittest import mock
+
+import pytest
+
+from inference.core.exceptions import OnnxProviderNotAvailable
+from inference.core.models.utils import onnx
+from inference.core.models.utils.onnx import (
+    get_effective_provider_names,
+    has_compiling_provider,
+    runs_on_cpu_only,
+    validate_required_providers_available,
+)
+
+
+def test_runs_on_cpu_only_when_only_cpu_provider_is_available() -> None:
+    # when
+    result = runs_on_cpu_only(
+        providers=["CUDAExecutionProvider", "CPUExecutionProvider"],
+        available_providers=["CPUExecutionProvider"],
+    )
+
+    # then
+    assert result is True
+
+
+def test_runs_on_cpu_only_when_accelerated_provider_is_available() -> None:
+    # when
+    result = runs_on_cpu_only(
+        providers=[
+            ("TensorrtExecutionProvider", {"trt_fp16_enable": True}),
+            "CPUExecutionProvider",
+        ],
+        available_providers=["TensorrtExecutionProvider", "CPUExecutionProvider"],
+    )
+
+    # then
+    assert result is False
+
+
+def test_has_compiling_provider_when_compiling_provider_is_not_available() -> None:
+    # when
+    result = has_compiling_provider(
+        providers=["OpenVINOExecutionProvider", "CPUExecutionProvider"],
+        available_providers=["CUDAExecutionProvider", "CPUExecutionProvider"],
+    )
+
+    # then
+    assert result is False
+
+
+def test_has_compiling_provider_when_compiling_provider_is_available() -> None:
+    # when
+    result = has_compiling_provider(
+        providers=["OpenVINOExecutionProvider", "CPUExecutionProvider"],
+        available_providers=["OpenVINOExecutionProvider", "CPUExecutionProvider"],
+    )
+
+    # then
+    assert result is True
+
+
+def test_get_effective_provider_names() -> None:
+    # when
+    result = get_effective_provider_names(
+        providers=[
+            ("TensorrtExecutionProvider", {"trt_fp16_enable": True}),
+            "CUDAExecutionProvider",
+            "CPUExecutionProvider",
+        ],
+        available_providers=["CUDAExecutionProvider", "CPUExecutionProvider"],
+    )
+
+    # then
+    assert result == ["CUDAExecutionProvider", "CPUExecutionProvider"]
+
+
+@mock.patch.object(
+    onnx,
+    "get_available_providers",
+    return_value=("CUDAExecutionProvider", "CPUExecutionProvider"),
+)
+def test_validate_required_providers_available_when_providers_are_available(
+    _: mock.MagicMock,
+) -> None:
+    # when
+    validate_required_providers_available(required_providers=["CUDAExecutionProvider"])
+
+    # then - no error
+
+
+@mock.patch.object(
+    onnx, "get_available_providers", return_value=("CPUExecutionProvider",)
+)
+def test_validate_required_providers_available_when_provider_is_missing(
+    _: mock.MagicMock,
+) -> None:
+    # when
+    with pytest.raises(OnnxProviderNotAvailable):
+        validate_required_providers_available(
+            required_providers=["CPUExecutionProvider", "CUDAExecutionProvider"]
+        )
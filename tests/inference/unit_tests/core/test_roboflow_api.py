@@ -1,3 +1,5 @@
+import os
+import time
 from typing import Type
 from unittest import mock
 from unittest.mock import MagicMock
@@ -24,6 +26,9 @@ from inference.core.exceptions import (
 from inference.core.roboflow_api import (
     ModelEndpointType,
     annotate_image_at_roboflow,
+    cached_with_ttl,
+    clear_roboflow_metadata_cache,
+    download_file_from_url,
     get_roboflow_active_learning_configuration,
     get_roboflow_dataset_type,
     get_roboflow_labeling_batches,
@@ -43,6 +48,11 @@ class TestException(Exception):
     pass
 
 
+@pytest.fixture(autouse=True)
+def clear_metadata_cache() -> None:
+    clear_roboflow_metadata_cache()
+
+
 def test_wrap_roboflow_api_errors_when_no_error_occurs() -> None:
     # given
 
@@ -175,7 +185,7 @@ def test_get_roboflow_workspace_when_wrong_api_key_used(requests_mock: Mocker) -
     assert requests_mock.last_request.query == "api_key=my_api_key&nocache=true"
 
 
-@mock.patch.object(roboflow_api.requests, "get")
+@mock.patch.object(roboflow_api._SESSION, "get")
 def test_get_roboflow_workspace_when_connection_error_occurs(
     get_mock: MagicMock,
 ) -> None:
@@ -278,7 +288,7 @@ def test_get_roboflow_dataset_type_when_project_not_found_used(
     assert requests_mock.last_request.query == "api_key=my_api_key&nocache=true"
 
 
-@mock.patch.object(roboflow_api.requests, "get")
+@mock.patch.object(roboflow_api._SESSION, "get")
 def test_get_roboflow_dataset_type_when_connection_error_occurs(
     get_mock: MagicMock,
 ) -> None:
@@ -422,7 +432,7 @@ def test_get_roboflow_model_type_when_wrong_version_used(
     assert requests_mock.last_request.query == "api_key=my_api_key&nocache=true"
 
 
-@mock.patch.object(roboflow_api.requests, "get")
+@mock.patch.object(roboflow_api._SESSION, "get")
 def test_get_roboflow_model_type_when_connection_error_occurs(
     get_mock: MagicMock,
 ) -> None:
@@ -532,7 +542,29 @@ def test_get_roboflow_model_type_when_response_is_valid(
     assert result == "yolov8n"
 
 
-@mock.patch.object(roboflow_api.requests, "get")
+def test_get_roboflow_model_type_when_model_type_defined_for_task_without_default(
+    requests_mock: Mocker,
+) -> None:
+    # given
+    requests_mock.get(
+        url=wrap_url(f"{API_BASE_URL}/my_workspace/coins_detection/1"),
+        json={"version": {"modelType": "paligemma-3b-pt-224"}},
+    )
+
+    # when
+    result = get_roboflow_model_type(
+        api_key="my_api_key",
+        workspace_id="my_workspace",
+        dataset_id="coins_detection",
+        version_id="1",
+        project_task_type="multimodal",
+    )
+
+    # then
+    assert result == "paligemma-3b-pt-224"
+
+
+@mock.patch.object(roboflow_api._SESSION, "get")
 def test_get_roboflow_model_data_when_connection_error_occurs(
     get_mock: MagicMock,
 ) -> None:
@@ -1254,7 +1286,7 @@ def test_annotate_image_at_roboflow_when_successful_response_expected(
     assert result == {"success": True}
 
 
-@mock.patch.object(roboflow_api.requests, "get")
+@mock.patch.object(roboflow_api._SESSION, "get")
 def test_get_roboflow_labeling_batches_when_connection_error_occurs(
     get_mock: MagicMock,
 ) -> None:
@@ -1414,7 +1446,7 @@ def test_get_roboflow_labeling_batches_when_valid_response_returned(
     assert requests_mock.last_request.query == "api_key=my_api_key"
 
 
-@mock.patch.object(roboflow_api.requests, "get")
+@mock.patch.object(roboflow_api._SESSION, "get")
 def test_get_roboflow_labeling_jobs_when_connection_error_occurs(
     get_mock: MagicMock,
 ) -> None:
@@ -1578,7 +1610,7 @@ def test_get_roboflow_labeling_jobs_when_valid_response_returned(
     assert requests_mock.last_request.query == "api_key=my_api_key"
 
 
-@mock.patch.object(roboflow_api.requests, "get")
+@mock.patch.object(roboflow_api._SESSION, "get")
 def test_get_roboflow_active_learning_configuration_when_connection_error_occurs(
     get_mock: MagicMock,
 ) -> None:
@@ -1686,7 +1718,7 @@ def test_get_roboflow_active_learning_configuration_when_malformed_response_retu
     ), "API key must be given in query"
 
 
-@mock.patch.object(roboflow_api.requests, "get")
+@mock.patch.object(roboflow_api._SESSION, "get")
 def test_get_workflow_specification_when_connection_error_occurs(
     get_mock: MagicMock,
 ) -> None:
@@ -1891,3 +1923,215 @@ def test_get_workflow_specification_when_valid_response_given(
         },
         "preset": "single-model",
     }
+
+
+def test_download_file_from_url_when_download_succeeds(
+    requests_mock: Mocker,
+    empty_local_dir: str,
+) -> None:
+    # given
+    requests_mock.get(
+        url=wrap_url("https://some.com/weights.onnx"),
+        content=b"weights",
+    )
+    target_path = os.path.join(empty_local_dir, "some", "1", "weights.onnx")
+
+    # when
+    download_file_from_url(url="https://some.com/weights.onnx", target_path=target_path)
+
+    # then
+    with open(target_path, "rb") as f:
+        assert f.read() == b"weights"
+    assert os.listdir(os.path.dirname(target_path)) == ["weights.onnx"]
+
+
+def test_download_file_from_url_when_request_fails(
+    requests_mock: Mocker,
+    empty_local_dir: str,
+) -> None:
+    # given
+    requests_mock.get(
+        url=wrap_url("https://some.com/weights.onnx"),
+        status_code=500,
+    )
+    target_path = os.path.join(empty_local_dir, "weights.onnx")
+
+    # when
+    with pytest.raises(RoboflowAPIUnsuccessfulRequestError):
+        download_file_from_url(
+            url="https://some.com/weights.onnx", target_path=target_path
+        )
+
+    # then
+    assert os.listdir(empty_local_dir) == []
+
+
+def test_api_session_retries_idempotent_requests_without_raising_on_status() -> None:
+    # when
+    adapter = roboflow_api._SESSION.get_adapter(url=f"{API_BASE_URL}/some")
+
+    # then
+    assert adapter.max_retries.total == 3
+    assert adapter.max_retries.raise_on_status is False
+    assert 503 in adapter.max_retries.status_forcelist
+    assert 500 not in adapter.max_retries.status_forcelist
+    assert adapter.max_retries.respect_retry_after_header is False
+    assert "POST" not in adapter.max_retries.allowed_methods
+
+
+def test_get_from_url_when_request_times_out() -> None:
+    # given
+    with mock.patch.object(roboflow_api._SESSION, "get") as get_mock:
+        get_mock.side_effect = requests.exceptions.ConnectTimeout()
+
+        # when
+        with pytest.raises(RoboflowAPIConnectionError):
+            _ = roboflow_api.get_from_url(url="https://some.com")
+
+    # then
+    assert get_mock.call_args[1]["timeout"] == roboflow_api.API_REQUEST_TIMEOUT
+
+
+def test_cached_with_ttl_when_called_twice_with_the_same_arguments() -> None:
+    # given
+    calls = []
+
+    @cached_with_ttl()
+    def my_fun(a: int, b: int) -> int:
+        calls.append((a, b))
+        return a + b
+
+    # when
+    first_result = my_fun(2, b=3)
+    second_result = my_fun(2, b=3)
+    third_result = my_fun(3, b=3)
+
+    # then
+    assert first_result == second_result == 5
+    assert third_result == 6
+    assert calls == [(2, 3), (3, 3)]
+
+
+def test_cached_with_ttl_when_entry_expired() -> None:
+    # given
+    calls = []
+
+    @cached_with_ttl()
+    def my_fun(a: int) -> int:
+        calls.append(a)
+        return a
+
+    # when
+    _ = my_fun(1)
+    expired_time = time.monotonic() + roboflow_api.ROBOFLOW_METADATA_TTL_SECONDS
+    with mock.patch.object(roboflow_api.time, "monotonic") as monotonic_mock:
+        monotonic_mock.return_value = expired_time
+        _ = my_fun(1)
+
+    # then
+    assert calls == [1, 1]
+
+
+def test_cached_with_ttl_when_wrapped_function_raises_error() -> None:
+    # given
+    calls = []
+
+    @cached_with_ttl()
+    def my_fun(a: int) -> int:
+        calls.append(a)
+        raise TestException()
+
+    # when
+    for _ in range(2):
+        with pytest.raises(TestException):
+            _ = my_fun(1)
+
+    # then
+    assert calls == [1, 1]
+
+
+def test_get_roboflow_workspace_when_called_twice(requests_mock: Mocker) -> None:
+    # given
+    requests_mock.get(
+        url=wrap_url(f"{API_BASE_URL}/"),
+        json={"workspace": "my_workspace"},
+    )
+
+    # when
+    first_result = get_roboflow_workspace(api_key="my_api_key")
+    second_result = get_roboflow_workspace(api_key="my_api_key")
+
+    # then
+    assert first_result == second_result == "my_workspace"
+    assert requests_mock.call_count == 1
+
+
+@mock.patch.object(roboflow_api, "ROBOFLOW_CACHE_FALLBACK", True)
+def test_cached_with_ttl_when_fallback_enabled_and_api_unreachable() -> None:
+    # given
+    responses = iter([lambda: "first", lambda: "second", _raise_connection_error])
+
+    @cached_with_ttl(ttl_seconds=0)
+    @wrap_roboflow_api_errors()
+    def my_fun(a: int) -> str:
+        return next(responses)()
+
+    # when
+    _ = my_fun(1)
+    _ = my_fun(1)
+    result = my_fun(1)
+
+    # then
+    assert result == "second"
+
+
+@mock.patch.object(roboflow_api, "ROBOFLOW_CACHE_FALLBACK", True)
+def test_cached_with_ttl_when_fallback_enabled_and_api_responds_with_server_error(
+    requests_mock: Mocker,
+) -> None:
+    # given
+    url = "https://some.com/"
+    requests_mock.get(url=url, response_list=[{"json": {"a": 1}}, {"status_code": 503}])
+    get_data = cached_with_ttl(ttl_seconds=0)(roboflow_api.get_from_url)
+
+    # when
+    _ = get_data(url=url)
+    result = get_data(url=url)
+
+    # then
+    assert result == {"a": 1}
+    assert requests_mock.call_count == 2
+
+
+@mock.patch.object(roboflow_api, "ROBOFLOW_CACHE_FALLBACK", True)
+def test_cached_with_ttl_when_fallback_enabled_and_api_responds_with_client_error(
+    requests_mock: Mocker,
+) -> None:
+    # given
+    url = "https://some.com/"
+    requests_mock.get(url=url, response_list=[{"json": {"a": 1}}, {"status_code": 403}])
+    get_data = cached_with_ttl(ttl_seconds=0)(roboflow_api.get_from_url)
+
+    # when
+    _ = get_data(url=url)
+    with pytest.raises(RoboflowAPIUnsuccessfulRequestError):
+        _ = get_data(url=url)
+
+
+def test_cached_with_ttl_when_fallback_disabled_and_api_unreachable() -> None:
+    # given
+    responses = iter([lambda: "first", _raise_connection_error])
+
+    @cached_with_ttl(ttl_seconds=0)
+    @wrap_roboflow_api_errors()
+    def my_fun(a: int) -> str:
+        return next(responses)()
+
+    # when
+    _ = my_fun(1)
+    with pytest.raises(RoboflowAPIConnectionError):
+        _ = my_fun(1)
+
+
+def _raise_connection_error() -> None:
+    raise requests.exceptions.ConnectionError()
@@ -1,6 +1,7 @@
 from unittest import mock
 from unittest.mock import MagicMock
 
+import cv2
 import numpy as np
 import pytest
 
@@ -11,7 +12,10 @@ from inference.core.utils.preprocess import (
     apply_contrast_adjustment,
     contrast_adjustments_should_be_applied,
     grayscale_conversion_should_be_applied,
+    letterbox_image,
     prepare,
+    resize_image,
+    resize_image_keeping_aspect_ratio,
     static_crop_should_be_applied,
     take_static_crop,
 )
@@ -296,3 +300,79 @@ def test_prepare_when_misconfiguration_error_is_encountered(
             image=np.zeros((128, 128, 3), dtype=np.uint8),
             preproc={"static-crop": {"enabled": True}},
         )
+
+
+@pytest.mark.parametrize(
+    "image_shape, desired_size",
+    [
+        ((1080, 1920, 3), (640, 640)),
+        ((517, 333, 3), (641, 383)),
+        ((480, 640), (320, 480)),
+    ],
+)
+def test_letterbox_image_matches_constant_border_padding(
+    image_shape: tuple, desired_size: tuple
+) -> None:
+    # given
+    image = np.random.randint(0, 255, image_shape, dtype=np.uint8)
+    resized_image = resize_image_keeping_aspect_ratio(
+        image=image, desired_size=desired_size
+    )
+    new_height, new_width = resized_image.shape[:2]
+    top_padding = (desired_size[1] - new_height) // 2
+    left_padding = (desired_size[0] - new_width) // 2
+    expected_result = cv2.copyMakeBorder(
+        resized_image,
+        top_padding,
+        desired_size[1] - new_height - top_padding,
+        left_padding,
+        desired_size[0] - new_width - left_padding,
+        cv2.BORDER_CONSTANT,
+        value=(114, 115, 116),
+    )
+
+    # when
+    result = letterbox_image(
+        image=image, desired_size=desired_size, color=(114, 115, 116)
+    )
+
+    # then
+    assert np.array_equal(result, expected_result)
+
+
+@pytest.mark.parametrize(
+    "opencl_available, expected_umat_calls", [(True, 1), (False, 0)]
+)
+def test_resize_image_when_image_is_large(
+    opencl_available: bool, expected_umat_calls: int
+) -> None:
+    # given
+    image = np.random.randint(0, 255, (64, 96, 3), dtype=np.uint8)
+
+    # when
+    with mock.patch.object(
+        preprocess, "OPENCL_RESIZE_AVAILABLE", opencl_available
+    ), mock.patch.object(
+        preprocess, "PREPROC_OPENCL_MIN_PIXELS", 64 * 96
+    ), mock.patch.object(
+        preprocess.cv2, "UMat", wraps=cv2.UMat
+    ) as umat_mock:
+        result = resize_image(image=image, size=(48, 32))
+
+    # then
+    assert umat_mock.call_count == expected_umat_calls
+    assert np.allclose(result, cv2.resize(image, (48, 32)), atol=1)
+
+
+@mock.patch.object(preprocess, "OPENCL_RESIZE_AVAILABLE", True)
+@mock.patch.object(preprocess.cv2, "UMat")
+def test_resize_image_when_image_is_small(umat_mock: MagicMock) -> None:
+    # given
+    image = np.random.randint(0, 255, (64, 96, 3), dtype=np.uint8)
+
+    # when
+    result = resize_image(image=image, size=(48, 32))
+
+    # then
+    umat_mock.assert_not_called()
+    assert np.array_equal(result, cv2.resize(image, (48, 32)))
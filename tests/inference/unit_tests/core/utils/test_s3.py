@@ -1,6 +1,8 @@
 from unittest import mock
 from unittest.mock import MagicMock, call
 
+from boto3.s3.transfer import TransferConfig
+
 from inference.core.utils import s3
 from inference.core.utils.s3 import download_s3_files_to_directory
 
@@ -30,3 +32,29 @@ def test_download_s3_files_to_directory(makedirs_mock: MagicMock) -> None:
         ]
     )
     makedirs_mock.assert_called_once_with("/some/local/dir", exist_ok=True)
+
+
+@mock.patch.object(s3.os, "makedirs")
+def test_download_s3_files_to_directory_when_transfer_config_given(
+    makedirs_mock: MagicMock,
+) -> None:
+    # given
+    s3_client = MagicMock()
+    transfer_config = TransferConfig(max_concurrency=16)
+
+    # when
+    download_s3_files_to_directory(
+        bucket="some-bucket",
+        keys=["weights.onnx"],
+        target_dir="/some/local/dir",
+        s3_client=s3_client,
+        transfer_config=transfer_config,
+    )
+
+    # then
+    s3_client.download_file.assert_called_once_with(
+        "some-bucket",
+        "weights.onnx",
+        "/some/local/dir/weights.onnx",
+        Config=transfer_config,
+    )
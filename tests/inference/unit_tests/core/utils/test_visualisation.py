@@ -1,5 +1,13 @@
+import numpy as np
+import pytest
+
 from inference.core.entities.responses.inference import ObjectDetectionPrediction
-from inference.core.utils.visualisation import bbox_to_points
+from inference.core.utils.visualisation import (
+    DEFAULT_COLOR,
+    bbox_to_points,
+    draw_labels,
+    hex_to_rgb,
+)
 
 
 def test_bbox_to_points() -> None:
@@ -23,3 +31,54 @@ def test_bbox_to_points() -> None:
 
     # then
     assert result == ((5, 16), (15, 24))
+
+
+def test_hex_to_rgb() -> None:
+    # when
+    result = hex_to_rgb("#4892EA")
+
+    # then
+    assert result == (72, 146, 234)
+
+
+def test_hex_to_rgb_when_alpha_channel_given() -> None:
+    # when
+    result = hex_to_rgb("#4892EA80")
+
+    # then
+    assert result == (72, 146, 234)
+
+
+@pytest.mark.parametrize("hex_color", ["#FFF", "", "#GGGGGG", None])
+def test_hex_to_rgb_when_malformed_value_given(hex_color: str) -> None:
+    # when
+    result = hex_to_rgb(hex_color)
+
+    # then
+    assert result == DEFAULT_COLOR
+
+
+def test_draw_labels() -> None:
+    # given
+    image = np.zeros((100, 200, 3), dtype=np.uint8)
+    bbox = ObjectDetectionPrediction(
+        **{
+            "x": 50.0,
+            "y": 50.0,
+            "width": 40.0,
+            "height": 40.0,
+            "confidence": 0.9,
+            "class": "a",
+            "class_confidence": None,
+            "class_id": 1,
+            "tracker_id": None,
+        }
+    )
+
+    # when
+    result = draw_labels(image=image, box=bbox, color=(72, 146, 234))
+
+    # then
+    assert result[31, 31].tolist() == [72, 146, 234]
+    assert np.any(np.all(result[30:60, 30:120] == 255, axis=-1))
+    assert result[0, 0].tolist() == [0, 0, 0]